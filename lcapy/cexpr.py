@@ -13,6 +13,8 @@ class cExpr(Expr):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, val, **assumptions):
 
         symbols = symbols_find(val)
@@ -34,6 +36,8 @@ class cExpr(Expr):
 
 class Vconst(cExpr):
 
+    __slots__ = ()
+
     def __init__(self, val, **assumptions):
 
         assumptions['dc'] = True        
@@ -50,6 +54,8 @@ class Vconst(cExpr):
     
 class Iconst(cExpr):
 
+    __slots__ = ()
+
     def __init__(self, val, **assumptions):
 
         super(Iconst, self).__init__(val, **assumptions)
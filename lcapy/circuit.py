@@ -99,11 +99,27 @@ class Circuit(Netlist):
     The s-domain model can be drawn using:
     cct.s_model().draw()
 
+    The MNA equations are solved by inverting the A matrix unless
+    solver='fraction-free' is specified, in which case sparse,
+    fraction-free elimination is used.  This is much faster for large
+    symbolic circuits:
+    cct = Circuit('filter.sch', solver='fraction-free')
+
+    If all the component values are numeric, the node voltages and
+    branch currents can be found numerically using:
+    Vdict, Idict = cct.numeric_solve('dc')
+
+    The node voltages and branch currents are fully simplified unless
+    another simplify_level is specified ('none', 'cancel', or
+    'factor').  For example, if only numerical values are required:
+    cct = Circuit('filter.sch', simplify_level='none')
+
     """
 
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, solver=None, simplify_level=None):
 
-        super(Circuit, self).__init__(filename)
+        super(Circuit, self).__init__(filename, solver=solver,
+                                      simplify_level=simplify_level)
 
     def netfile_add(self, filename):
         """Add the nets from file with specified filename"""
@@ -1,6 +1,82 @@
 # SymPy symbols to exclude
 exclude  = ('C', 'O', 'S', 'N', 'E', 'E1', 'Q', 'beta', 'gamma', 'zeta')
 
+# Default method for solving the MNA equations.  This can be
+# 'inverse' to invert the A matrix or 'fraction-free' for sparse,
+# fraction-free elimination (faster for large symbolic circuits).
+# It can be overridden for each circuit with the solver argument.
+mna_solver = 'inverse'
+
+# Simplification of the node voltages and branch currents found by
+# the MNA solver.  This can be 'none', 'cancel' (cancel common factors
+# of rational functions), 'factor', or 'full' (SymPy simplify).  It can
+# be overridden for each circuit with the simplify_level argument.
+mna_simplify_level = 'full'
+
+# If True, the node voltages and branch currents found by the MNA
+# solver are simplified when they are first required; with the
+# fraction-free solver they are also only solved for when first
+# required.  Otherwise, they are all found and simplified when the
+# circuit is solved.
+mna_lazy = True
+
+# Size of the MNA A matrix at which the numerical MNA solver switches
+# from a dense to a sparse solver.
+numeric_sparse_size = 100
+
+# Maximum number of elements in the stacked A matrices when the MNA
+# equations are solved for a batch of frequencies.
+numeric_sweep_size = 2000000
+
+# Number of points in the grid of parameter values at which a
+# parameter sweep is split between config.sweep_processes processes.
+# If sweep_processes is None, a process is used for each CPU.
+sweep_parallel_size = 1000000
+sweep_processes = None
+
+# Directory for the on-disk cache of the solved MNA equations.  The
+# cache is disabled if this is None.
+mna_cache_dir = None
+
+# Maximum size of the on-disk MNA cache in bytes.  The least recently
+# used entries are removed when this is exceeded.
+mna_cache_size = 100 * 1024 * 1024
+
+# Directory for the on-disk cache of schematics rendered to PDF, PNG,
+# or SVG files.  The cache is disabled if this is None.
+render_cache_dir = None
+
+# Maximum size of the on-disk render cache in bytes.
+render_cache_size = 100 * 1024 * 1024
+
+# Number of processes used to draw a batch of schematics.  If None, a
+# process is used for each CPU.
+render_processes = None
+
+# Maximum number of results stored in each of the Laplace and Fourier
+# transform caches.  The least recently used results are discarded.
+transform_cache_size = 1000
+
+# Maximum number of strings, such as component values, whose parsed
+# SymPy expressions are cached.
+parse_cache_size = 10000
+
+# Maximum number of strings whose symbols, found by symbols_find, are
+# cached.
+symbols_cache_size = 10000
+
+# Maximum number of functions, created by lambdify, that are cached
+# for the numerical evaluation of expressions.
+evaluate_cache_size = 256
+
+# If True and numexpr is installed, use numexpr to evaluate
+# expressions for arrays of values where possible.
+evaluate_numexpr = False
+
+# Number of samples processed at a time when filtering a signal to
+# find the response of a system.
+response_chunk_size = 65536
+
 # Aliases for SymPy symbols
 aliases = {'delta': 'DiracDelta', 'step': 'Heaviside', 'u': 'Heaviside',
            'j': 'I'}
@@ -17,6 +17,8 @@ from .sym import capitalize_name, tsym, symsymbol
 from .context import context
 from .printing import pprint, pretty, print_str, latex
 from .functions import sqrt, log10, atan2, gcd
+from . import config
+from .transformcache import TransformCache
 import numpy as np
 import sympy as sym
 from sympy.utilities.lambdify import lambdify
@@ -41,10 +43,91 @@ class Exprdict(dict):
         p.text(pretty(self))
 
 
+def _exp(arg):
+
+    # Hack to handle exp(-a * t) * Heaviside(t) for t < 0
+    # by trying to avoid inf when number overflows float.
+    if np.iscomplexobj(arg):
+        arg = np.minimum(np.real(arg), 500) + 1j * np.imag(arg)
+    else:
+        arg = np.minimum(arg, 500)
+    return np.exp(arg)
+
+
+def _dirac(arg):
+
+    return np.where(np.asarray(arg) == 0.0, np.inf, 0.0)
+
+
+def _heaviside(arg):
+
+    return np.where(np.asarray(arg) >= 0.0, 1.0, 0.0)
+
+
+def _sqrt(arg):
+
+    # For negative arguments, np.sqrt will return Nan.
+    # np.lib.scimath.sqrt converts to complex but cannot be used
+    # for lamdification!
+    if not np.iscomplexobj(arg) and np.any(np.asarray(arg) < 0):
+        arg = arg + 0j
+    return np.sqrt(arg)
+
+
+def _numexpr_ok(expr):
+    """Return True if expr does not need the special handling of
+    Heaviside, DiracDelta, and sqrt."""
+
+    if expr.has(sym.Heaviside, sym.DiracDelta):
+        return False
+    for pow in expr.atoms(sym.Pow):
+        if not pow.exp.is_integer:
+            return False
+    return True
+
+
+# The functions cannot be pickled so they are not saved with the
+# transform caches.
+lambdify_cache = TransformCache('evaluate', persist=False)
+
+
+def _lambdify(expr, var, module='numpy'):
+    """Return function to numerically evaluate expr for values of var.
+    The functions are cached since lambdify is slow.  None is returned
+    if the module is 'numexpr' and numexpr is not available."""
+
+    key = (expr, var, module)
+    result = lambdify_cache.get(key)
+    if result is not None:
+        return result[0]
+
+    if module == 'numexpr':
+        try:
+            import numexpr
+            func = lambdify(var, expr, 'numexpr')
+        except ImportError:
+            func = None
+    else:
+        func = lambdify(var, expr,
+                        ({'DiracDelta' : _dirac,
+                          'Heaviside' : _heaviside,
+                          'sqrt' : _sqrt, 'exp' : _exp},
+                         "numpy", "sympy", "math"))
+
+    lambdify_cache[key] = (func, )
+    return func
+
+
 class Expr(object):
 
     """Decorator class for sympy classes derived from sympy.Expr"""
 
+    # Subclasses must also define __slots__ so that instances do not
+    # have a dictionary.
+    __slots__ = ('expr', 'assumptions', '_laplace_conjugate_class',
+                 '_fourier_conjugate_class', 'part', '_units',
+                 '_domain_name', '_domain_units')
+
     one_sided = False
     var = None
 
@@ -415,6 +498,10 @@ class Expr(object):
         if x is None:
             return False
 
+        # Interned expressions can be compared by identity.
+        if x.__class__ == self.__class__ and x.expr is self.expr:
+            return True
+
         try:
             cls, self, x, assumptions = self.__compat_add__(x, '==')
         except ValueError:
@@ -667,7 +754,7 @@ class Expr(object):
         # Assume reference is 1.
         dst = 20 * log10(self.magnitude)
         dst.part = 'magnitude'
-        dst.units = 'dB'
+        dst._units = 'dB'
         return dst
 
     @property
@@ -686,7 +773,7 @@ class Expr(object):
             dst = atan2(N.imag, N.real)
             
         dst.part = 'phase'
-        dst.units = 'rad'
+        dst._units = 'rad'
         return dst
 
     @property
@@ -695,7 +782,7 @@ class Expr(object):
 
         dst = self.phase * 180.0 / sym.pi
         dst.part = 'phase'
-        dst.units = 'degrees'
+        dst._units = 'degrees'
         return dst
 
     @property
@@ -732,34 +819,6 @@ class Expr(object):
 
         def evaluate_expr(expr, var, arg):
 
-            # For some reason the new lambdify will convert a float
-            # argument to complex
-            
-            def exp(arg):
-
-                # Hack to handle exp(-a * t) * Heaviside(t) for t < 0
-                # by trying to avoid inf when number overflows float.
-
-                if isinstance(arg, complex):
-                    if arg.real > 500:
-                        arg = 500 + 1j * arg.imag
-                elif arg > 500:
-                    arg = 500;                        
-
-                return np.exp(arg)
-
-            def dirac(arg):
-                return np.inf if arg == 0.0 else 0.0
-
-            def heaviside(arg):
-
-                return 1.0 if arg >= 0.0 else 0.0
-
-            def sqrt(arg):
-                if not isinstance(arg, complex) and arg < 0:
-                    arg = arg + 0j
-                return np.sqrt(arg)
-
             try:
                 arg0 = arg[0]
                 scalar = False
@@ -767,41 +826,44 @@ class Expr(object):
                 arg0 = arg
                 scalar = True
 
-            # For negative arguments, np.sqrt will return Nan.
-            # np.lib.scimath.sqrt converts to complex but cannot be used
-            # for lamdification!
-            func = lambdify(var, expr,
-                            ({'DiracDelta' : dirac,
-                              'Heaviside' : heaviside,
-                              'sqrt' : sqrt, 'exp' : exp},
-                             "numpy", "sympy", "math"))
+            func = _lambdify(expr, var)
+            if not scalar:
+                arg = np.asarray(arg)
+                arg0 = arg
+                if config.evaluate_numexpr and _numexpr_ok(expr):
+                    func = _lambdify(expr, var, 'numexpr') or func
 
             try:
                 result = func(arg0)
-                response = complex(result)
+                if scalar:
+                    response = complex(result)
+                else:
+                    # The result is a scalar if the expression is
+                    # a constant.
+                    response = np.broadcast_to(result, arg.shape)
+                    response = response.astype(complex)
             except NameError:
                 raise RuntimeError('Cannot evaluate expression %s' % self)
-            except (AttributeError, TypeError):
+            except (AttributeError, TypeError, ValueError):
                 if expr.is_Piecewise:
                     raise RuntimeError(
                         'Cannot evaluate expression %s,'
                         ' due to undetermined conditional result' % self)
-
-                raise RuntimeError(
-                    'Cannot evaluate expression %s,'
-                    ' probably have a mysterious function' % self)
-
-            if scalar:
-                if np.allclose(response.imag, 0.0):
-                    response = response.real
-                return response
-
-            try:
-                response = np.array([complex(func(arg0)) for arg0 in arg])
-            except TypeError:
-                raise TypeError(
-                    'Cannot evaluate expression %s,'
-                    ' probably have undefined symbols' % self)
+                if not scalar:
+                    # Some functions cannot be evaluated for a vector;
+                    # evaluate element by element.
+                    func = _lambdify(expr, var)
+                    try:
+                        response = np.array([complex(func(arg0))
+                                             for arg0 in arg])
+                    except TypeError:
+                        raise TypeError(
+                            'Cannot evaluate expression %s,'
+                            ' probably have undefined symbols' % self)
+                else:
+                    raise RuntimeError(
+                        'Cannot evaluate expression %s,'
+                        ' probably have a mysterious function' % self)
 
             if np.allclose(response.imag, 0.0):
                 response = response.real
@@ -855,6 +917,39 @@ class Expr(object):
         result[arg < 0] = sym.nan
         return result
 
+    def sweep(self, params, arg=None):
+        """Evaluate expression for every combination of the values of
+        the parameters specified by the dictionary params, and at arg
+        (a scalar or a vector).  For example,
+
+        >>> H.sweep({'R': [1e3, 1e4], 'C': Cvalues}, svector)
+
+        returns an array of shape (2, len(Cvalues), len(svector)).
+        The expression is only converted to a function once, with
+        the parameters as extra arguments.  The result is of type
+        float or complex.
+
+        There can be no symbols in the expression except for the
+        variable and the parameters.
+        """
+
+        from .paramsweep import expr_sweep
+
+        var = getattr(self, 'var', None)
+        if arg is None:
+            var = None
+        elif var is None:
+            raise ValueError('Expression %s has no variable to evaluate'
+                             ' at %s' % (self, arg))
+        else:
+            arg = np.asarray(arg)
+        response = expr_sweep(self.expr, var, np.ravel(arg), params)
+        if var is not None and arg.ndim == 0:
+            response = response[..., 0]
+        if np.allclose(response.imag, 0.0):
+            response = response.real
+        return response
+
     def has(self, subexpr):
         """Test whether the sub-expression is contained.  For example,
          V.has(exp(t)) 
@@ -1020,20 +1115,32 @@ class Expr(object):
         else:
             if hasattr(self, 'part'):
                 label += capitalize_name(self.part)
-        if hasattr(self, 'units') and self.units != '':
-            label += ' (%s)' % self.units
+        units = self._label_attr('units')
+        if units is not None and units != '':
+            label += ' (%s)' % units
         return label
 
     @property
     def domain_label(self):
 
         label = ''
-        if hasattr(self, 'domain_name'):
-            label += '%s' % self.domain_name
-        if hasattr(self, 'domain_units'):
-            label += ' (%s)' % self.domain_units
+        domain_name = self._label_attr('domain_name')
+        if domain_name is not None:
+            label += '%s' % domain_name
+        domain_units = self._label_attr('domain_units')
+        if domain_units is not None:
+            label += ' (%s)' % domain_units
         return label
 
+    def _label_attr(self, name):
+        """Return the value of attribute name, say units, overridden
+        for this instance by _name, or None if not defined."""
+
+        try:
+            return object.__getattribute__(self, '_' + name)
+        except AttributeError:
+            return getattr(self.__class__, name, None)
+
     def differentiate(self, arg=None):
 
         if arg is None:
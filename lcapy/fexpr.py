@@ -8,6 +8,8 @@ class fExpr(sfwExpr):
 
     """Fourier domain expression or symbol."""
 
+    __slots__ = ()
+
     var = fsym
     domain_name = 'Frequency'
     domain_units = 'Hz'
@@ -19,10 +21,10 @@ class fExpr(sfwExpr):
         # Define when class defined.
         self._fourier_conjugate_class = tExpr
 
-        if self.expr.find(ssym) != set():
+        if ssym in self.expr.free_symbols:
             raise ValueError(
                 'f-domain expression %s cannot depend on s' % self.expr)
-        if self.expr.find(tsym) != set():
+        if tsym in self.expr.free_symbols:
             raise ValueError(
                 'f-domain expression %s cannot depend on t' % self.expr)
 
@@ -66,6 +68,8 @@ class Yf(fExpr):
 
     """f-domain admittance"""
 
+    __slots__ = ()
+
     quantity = 'Admittance'
     units = 'siemens'
 
@@ -79,6 +83,8 @@ class Zf(fExpr):
 
     """f-domain impedance"""
 
+    __slots__ = ()
+
     quantity = 'Impedance'
     units = 'ohms'
 
@@ -92,6 +98,8 @@ class Hf(fExpr):
 
     """f-domain transfer function response."""
 
+    __slots__ = ()
+
     quantity = 'Transfer function'
     units = ''
 
@@ -105,6 +113,8 @@ class Vf(fExpr):
 
     """f-domain voltage (units V/Hz)."""
 
+    __slots__ = ()
+
     quantity = 'Voltage spectrum'
     units = 'V/Hz'
 
@@ -118,6 +128,8 @@ class If(fExpr):
 
     """f-domain current (units A/Hz)."""
 
+    __slots__ = ()
+
     quantity = 'Current spectrum'
     units = 'A/Hz'
 
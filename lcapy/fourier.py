@@ -21,8 +21,9 @@ Copyright 2016--2019 Michael Hayes, UCECE
 
 import sympy as sym
 from .utils import factor_const, scale_shift
+from .transformcache import TransformCache
 
-fourier_cache = {}
+fourier_cache = TransformCache('fourier')
 
 def fourier_sympy(expr, t, f):
 
@@ -191,8 +192,9 @@ def fourier_transform(expr, t, f, inverse=False):
     """
 
     key = (expr, t, f, inverse)
-    if key in fourier_cache:
-        return fourier_cache[key]
+    result = fourier_cache.get(key)
+    if result is not None:
+        return result
 
     if not inverse and expr.has(f):
         raise ValueError('Cannot Fourier transform for expression %s that depends on %s' % (expr, f))
@@ -23,10 +23,11 @@ Copyright 2016--2019 Michael Hayes, UCECE
 
 from .ratfun import Ratfun
 from .utils import factor_const, scale_shift
+from .transformcache import TransformCache
 import sympy as sym
 
-laplace_cache = {}
-inverse_laplace_cache = {}
+laplace_cache = TransformCache('laplace')
+inverse_laplace_cache = TransformCache('inverse_laplace')
 
 
 def laplace_limits(expr, t, s, tmin, tmax):
@@ -171,8 +172,9 @@ def laplace_transform(expr, t, s):
     """
 
     key = (expr, t, s)
-    if key in laplace_cache:
-        return laplace_cache[key]
+    result = laplace_cache.get(key)
+    if result is not None:
+        return result
 
     if expr.has(s):
         raise ValueError('Cannot Laplace transform for expression %s that depends on %s' % (expr, s))
@@ -419,8 +421,9 @@ def inverse_laplace_transform(expr, s, t, **assumptions):
            assumptions.get('ac', False),
            assumptions.get('causal', False))
     
-    if key in inverse_laplace_cache:
-        return inverse_laplace_cache[key]
+    result = inverse_laplace_cache.get(key)
+    if result is not None:
+        return result
 
     if expr.has(t):
         raise ValueError('Cannot inverse Laplace transform for expression %s that depends on %s' % (expr, t))
@@ -432,6 +435,7 @@ def inverse_laplace_transform(expr, s, t, **assumptions):
         if 's' in free_symbols:
             raise ValueError('Something wonky going on, expecting dc.'
                              ' Perhaps have capacitors in series?')
+        inverse_laplace_cache[key] = result
         return result
 
     try:
@@ -5,16 +5,22 @@ Copyright 2014--2019 Michael Hayes, UCECE
 """
 
 from __future__ import division
-from .cexpr import Iconst, Vconst
+from .cexpr import Iconst, Vconst, cExpr
 from .texpr import It, Vt
 from .sexpr import Is, Vs
 from .phasor import Iphasor, Vphasor
 from .noiseexpr import In, Vn
 from .vector import Vector
 from .matrix import Matrix
-from .sym import symsimplify
+from .sym import symsimplify, ssym, tsym, omegasym
 from .expr import Exprdict
+from .sparsesolve import fraction_free_solve, FractionFreeSolver
+from .mnacache import cache_key, cache_load, cache_store
+from . import config
+from functools import partial
+import numpy as np
 import sympy as sym
+from sympy.utilities.lambdify import lambdify
 
 # Note, all the maths is performed using sympy expressions and the
 # values and converted to Expr when required.  This is more
@@ -42,7 +48,155 @@ def _Itype_select(kind):
         return Iphasor
 
     
-class Nodedict(Exprdict):
+class Stamps(dict):
+    """Sparse matrix of MNA stamps indexed by (row, col), or by row
+    for a vector.  Missing entries are zero."""
+
+    def __init__(self, rows, cols):
+
+        super(Stamps, self).__init__()
+        self.shape = (rows, cols)
+
+    def _key(self, key):
+
+        if isinstance(key, tuple):
+            return key
+        return (key, 0)
+
+    def __getitem__(self, key):
+
+        return self.get(self._key(key), 0)
+
+    def __setitem__(self, key, value):
+
+        super(Stamps, self).__setitem__(self._key(key), value)
+
+    def _join(self, other, roffset, coffset, shape):
+
+        new = Stamps(*shape)
+        new.update(self)
+        for (row, col), value in other.items():
+            new[row + roffset, col + coffset] = value
+        return new
+
+    def row_join(self, other):
+        """Join other to the right of self."""
+
+        return self._join(other, 0, self.shape[1],
+                          (self.shape[0], self.shape[1] + other.shape[1]))
+
+    def col_join(self, other):
+        """Join other below self."""
+
+        return self._join(other, self.shape[0], 0,
+                          (self.shape[0] + other.shape[0], self.shape[1]))
+
+    def matrix(self):
+        """Convert to a dense SymPy matrix."""
+
+        M = sym.zeros(*self.shape)
+        for (row, col), value in self.items():
+            M[row, col] = value
+        return M
+
+
+def _simplify(expr, level):
+    """Simplify SymPy expression expr using the specified level:
+    'none', 'cancel', 'factor', or 'full'."""
+
+    if level == 'none':
+        return expr
+    elif level == 'cancel':
+        return sym.cancel(expr)
+    elif level == 'factor':
+        return sym.factor(sym.cancel(expr))
+    elif level == 'full':
+        return symsimplify(expr)
+    raise ValueError('Unknown simplify level %s' % level)
+
+
+class Lazydict(Exprdict):
+    """Dictionary where a value can be specified by a function.  The
+    function is called to find the value when it is first required."""
+
+    def __init__(self, *args, **kwargs):
+
+        super(Lazydict, self).__init__(*args, **kwargs)
+        self._funcs = {}
+
+    def set_lazy(self, key, func):
+        """Set the value for key to be the result of func()."""
+
+        self._funcs[key] = func
+        super(Lazydict, self).__setitem__(key, None)
+
+    def __getitem__(self, key):
+
+        value = super(Lazydict, self).__getitem__(key)
+        if key in self._funcs:
+            value = self._funcs.pop(key)()
+            super(Lazydict, self).__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+
+        self._funcs.pop(key, None)
+        super(Lazydict, self).__setitem__(key, value)
+
+    def evaluate(self):
+        """Find all the values that have not yet been found."""
+
+        for key in list(self._funcs):
+            self[key]
+
+    def get(self, key, default=None):
+
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+
+        self.evaluate()
+        return super(Lazydict, self).items()
+
+    def values(self):
+
+        self.evaluate()
+        return super(Lazydict, self).values()
+
+    def copy(self):
+
+        self.evaluate()
+        return self.__class__(self)
+
+    def __repr__(self):
+
+        self.evaluate()
+        return super(Lazydict, self).__repr__()
+
+    def pprint(self):
+
+        self.evaluate()
+        return super(Lazydict, self).pprint()
+
+    def pretty(self):
+
+        self.evaluate()
+        return super(Lazydict, self).pretty()
+
+    def latex(self):
+
+        self.evaluate()
+        return super(Lazydict, self).latex()
+
+    def _repr_pretty_(self, p, cycle):
+
+        self.evaluate()
+        return super(Lazydict, self)._repr_pretty_(p, cycle)
+
+
+class Nodedict(Lazydict):
 
     def __getitem__(self, name):
         """Return node by name or number."""
@@ -53,7 +207,7 @@ class Nodedict(Exprdict):
         return super(Nodedict, self).__getitem__(name)
 
 
-class Branchdict(Exprdict):
+class Branchdict(Lazydict):
     pass
     
 
@@ -84,7 +238,9 @@ class MNA(object):
     """
 
     def _invalidate(self):
-        for attr in ('_A', '_Vdict', '_Idict', '_node_list'):
+        for attr in ('_A', '_Asparse', '_Ainv', '_Vdict', '_Idict',
+                     '_node_list', '_node_indexes', '_sweep_coeffs',
+                     '_shared_results', '_ports'):
             if hasattr(self, attr):
                 delattr(self, attr)
 
@@ -105,7 +261,11 @@ class MNA(object):
 
     def _node_index(self, node):
         """Return node index; ground is -1"""
-        return self.node_list.index(self.node_map[node]) - 1
+
+        if not hasattr(self, '_node_indexes'):
+            self._node_indexes = dict((node1, m - 1) for m, node1 in
+                                      enumerate(self.node_list))
+        return self._node_indexes[self.node_map[node]]
 
     def _branch_index(self, cpt_name):
 
@@ -115,10 +275,21 @@ class MNA(object):
         except ValueError:
             raise ValueError('Unknown component name %s for branch current' % cpt_name)
 
-    def _analyse(self):
-        """Analyse network."""
+    def _find_unknown_branch_currents(self):
+        """Determine which branch currents are needed."""
 
-        if hasattr(self, '_A'):
+        self.unknown_branch_currents = []
+
+        for elt in self.elements.values():
+            if elt.need_branch_current:
+                self.unknown_branch_currents.append(elt.name)
+            if elt.need_extra_branch_current:
+                self.unknown_branch_currents.append(elt.name + 'X')
+
+    def _stamp(self):
+        """Generate the sparse MNA stamps."""
+
+        if hasattr(self, '_Asparse'):
             return
 
         # Hack, to indirectly generate element list for network.
@@ -136,68 +307,133 @@ class MNA(object):
         if '0' not in self.node_map:
             raise RuntimeError('Nothing connected to ground node 0')
 
-        # Determine which branch currents are needed.
-        self.unknown_branch_currents = []
-
-        for elt in self.elements.values():
-            if elt.need_branch_current:
-                self.unknown_branch_currents.append(elt.name)
-            if elt.need_extra_branch_current:
-                self.unknown_branch_currents.append(elt.name + 'X')
+        self._find_unknown_branch_currents()
 
         # Generate stamps.
         num_nodes = len(self.node_list) - 1
         num_branches = len(self.unknown_branch_currents)
 
-        self._G = sym.zeros(num_nodes, num_nodes)
-        self._B = sym.zeros(num_nodes, num_branches)
-        self._C = sym.zeros(num_branches, num_nodes)
-        self._D = sym.zeros(num_branches, num_branches)
+        self._G = Stamps(num_nodes, num_nodes)
+        self._B = Stamps(num_nodes, num_branches)
+        self._C = Stamps(num_branches, num_nodes)
+        self._D = Stamps(num_branches, num_branches)
 
-        self._Is = sym.zeros(num_nodes, 1)
-        self._Es = sym.zeros(num_branches, 1)
+        self._Is = Stamps(num_nodes, 1)
+        self._Es = Stamps(num_branches, 1)
 
         # Iterate over circuit elements and fill in matrices.
         for elt in self.elements.values():
             elt.stamp(self)
 
         # Augment the admittance matrix to form A matrix.
-        self._A = self._G.row_join(self._B).col_join(self._C.row_join(self._D))
+        self._Asparse = self._G.row_join(self._B).col_join(
+            self._C.row_join(self._D))
         # Augment the known current vector with known voltage vector
         # to form Z vector.
-        self._Z = self._Is.col_join(self._Es)
+        self._Zsparse = self._Is.col_join(self._Es)
 
-    def _solve(self):
-        """Solve network."""
-        
-        if hasattr(self, '_Vdict'):
+    def _analyse(self):
+        """Analyse network."""
+
+        if hasattr(self, '_A'):
             return
+
+        self._stamp()
+        self._A = self._Asparse.matrix()
+        self._Z = self._Zsparse.matrix()
+
+    def _inverse(self):
+        """Return the inverse of the A matrix.  This is cached so that
+        it can be reused to solve for other right-hand sides, say for
+        different ports."""
+
+        if not hasattr(self, '_Ainv'):
+            self._Ainv = self._A.inv()
+        return self._Ainv
+
+    def _solve_rhs(self, Z, solver):
+        """Solve A X = Z for X."""
+
+        if solver == 'inverse':
+            return self._inverse() * Z
+        return fraction_free_solve(self._A, Z)
+
+    def _solve_ports(self, ports):
+        """Return matrix of the s-domain transfer impedances for the
+        ports specified by a list of node pairs (Np, Nm).  Element
+        (m, n) is the voltage across port m for a unit current into
+        port n.  This only requires solving the MNA equations for a
+        right-hand side for each port."""
+
+        solver = self.solver
+        if solver is None:
+            solver = config.mna_solver
+        level = self.simplify_level
+        if level is None:
+            level = config.mna_simplify_level
+
         self._analyse()
 
-        # Solve for the nodal voltages
+        E = sym.zeros(self._A.shape[0], len(ports))
+        for m, nodes in enumerate(ports):
+            for node, sign in zip(nodes, (1, -1)):
+                index = self._node_index('%s' % node)
+                if index >= 0:
+                    E[index, m] += sign
+
         try:
-            Ainv = self._A.inv()
+            X = self._solve_rhs(E, solver)
         except ValueError:
-            comment = ''
-            if self.kind == 'dc':
-                comment = '  Check there is a DC path between all nodes.'
-            raise ValueError(
-"""The MNA A matrix is not invertible for %s analysis because:
+            raise ValueError(self._singular_message())
+
+        Z = (E.T * X).subs(self.context.symbols)
+        return Z.applyfunc(lambda expr: _simplify(expr, level))
+
+    def _singular_message(self):
+
+        comment = ''
+        if self.kind == 'dc':
+            comment = '  Check there is a DC path between all nodes.'
+        return """The MNA A matrix is not invertible for %s analysis because:
 1. there may be capacitors in series;
 2. a voltage source might be short-circuited;
 3. a current source might be open-circuited.
-%s""" % (self.kind, comment))
-
-        results = symsimplify(Ainv * self._Z)
+%s""" % (self.kind, comment)
 
-        results = results.subs(self.context.symbols)
+    def _solve(self):
+        """Solve network."""
+        
+        if hasattr(self, '_Vdict'):
+            return
 
-        branchdict = {}
-        for elt in self.elements.values():
-            if elt.type == 'K':
-                continue
-            n1, n2 = self.node_map[elt.nodes[0]], self.node_map[elt.nodes[1]]
-            branchdict[elt.name] = (n1, n2)
+        solver = self.solver
+        if solver is None:
+            solver = config.mna_solver
+        if solver not in ('inverse', 'fraction-free'):
+            raise ValueError('Unknown MNA solver %s' % solver)
+
+        level = self.simplify_level
+        if level is None:
+            level = config.mna_simplify_level
+        if level not in ('none', 'cancel', 'factor', 'full'):
+            raise ValueError('Unknown simplify level %s' % level)
+
+        key = None
+        cached = None
+        if config.mna_cache_dir is not None:
+            key = cache_key(self.netlist(), self.node_map, self.kind, solver,
+                            level)
+            cached = cache_load(key)
+
+        # The node voltages and branch currents are simplified when
+        # they are first required unless the results are to be cached.
+        lazy = config.mna_lazy and key is None
+
+        if cached is None:
+            Vexprs, Iexprs = self._solve_exprs(solver, lazy)
+        else:
+            Vexprs, Iexprs = cached
+            self._find_unknown_branch_currents()
 
         self.context.switch()
 
@@ -212,37 +448,454 @@ class MNA(object):
                            'causal' : self.is_causal}
         elif isinstance(self.kind, str) and self.kind[0] == 'n':
             assumptions = {'nid' : self.kind}
-       
+
+        def simplified(etype, unknown):
+
+            self.context.switch()
+            try:
+                result = etype(_simplify(unknown(), level), **assumptions)
+            finally:
+                self.context.restore()
+            return result
+
+        def current(elt):
+
+            n1 = self.node_map[elt.nodes[0]]
+            n2 = self.node_map[elt.nodes[1]]                
+            V1, V2 = self._Vdict[n1], self._Vdict[n2]
+            I = (V1.expr - V2.expr) / elt.Z.expr
+            return simplified(itype, lambda: I)
+
         # Create dictionary of node voltages
         self._Vdict = Nodedict()
         self._Vdict['0'] = vtype(0, **assumptions)
+        for n in self.nodes:
+            if n not in Vexprs:
+                self._Vdict[n] = vtype(0, **assumptions)
+            elif cached is None:
+                self._Vdict.set_lazy(n, partial(simplified, vtype, Vexprs[n]))
+            else:
+                self._Vdict[n] = vtype(Vexprs[n], **assumptions)
+
+        # Create dictionary of branch currents through elements
+        self._Idict = Branchdict()
+        for name in self.unknown_branch_currents:
+            if cached is None:
+                self._Idict.set_lazy(name, partial(simplified, itype,
+                                                   Iexprs[name]))
+            else:
+                self._Idict[name] = itype(Iexprs[name], **assumptions)
+
+        # Calculate the branch currents from the node voltages.
+        RCnames = []
+        for elt in self.elements.values():
+            if elt.type in ('R', 'C'):
+                RCnames.append(elt.name)
+                if cached is None:
+                    self._Idict.set_lazy(elt.name, partial(current, elt))
+                else:
+                    self._Idict[elt.name] = itype(Iexprs[elt.name],
+                                                  **assumptions)
+            elif elt.type in ('I', ):
+                self._Idict[elt.name] = elt.Isc
+
+        self.context.restore()
+
+        if not lazy:
+            self._Vdict.evaluate()
+            self._Idict.evaluate()
+
+        if key is not None and cached is None:
+            Vexprs = dict((n, V.expr) for n, V in self._Vdict.items())
+            Iexprs = dict((name, self._Idict[name].expr) for name in
+                          self.unknown_branch_currents + RCnames)
+            cache_store(key, Vexprs, Iexprs)
+
+    def _matching_siblings(self, solver):
+        """Return list of the unsolved sub-netlists of the parent netlist
+        that have the same A matrix and thus can be solved at the same
+        time."""
+
+        others = []
+        for other in getattr(self, '_siblings', {}).values():
+            if (other is self or hasattr(other, '_Vdict') or
+                hasattr(other, '_shared_results')):
+                continue
+            other_solver = other.solver
+            if other_solver is None:
+                other_solver = config.mna_solver
+            if other_solver != solver or other.context is not self.context:
+                continue
+            try:
+                other._analyse()
+            except Exception:
+                # This will be reported when the sub-netlist is solved.
+                continue
+            if other._A.shape == self._A.shape and other._A == self._A:
+                others.append(other)
+        return others
+
+    def _solve_exprs(self, solver, lazy=False):
+        """Solve the MNA equations and return dictionaries of functions
+        that return the unsimplified SymPy expressions for the node
+        voltages and the unknown branch currents.
+
+        If lazy is True and the fraction-free solver is used, only the
+        elimination is performed here; the back substitution for an
+        unknown is performed when its function is first called.  The
+        inverse solver always finds all the unknowns since the inverse
+        of the A matrix is formed anyway."""
+
+        self._analyse()
+
+        if hasattr(self, '_shared_results'):
+            # Solved with another sub-netlist.
+            unknown = self._shared_results
+            del self._shared_results
+        else:
+            others = self._matching_siblings(solver)
+
+            # Solve for the nodal voltages, using a column of the
+            # right-hand side for each sub-netlist.
+            Z = self._Z
+            for other in others:
+                Z = Z.row_join(other._Z)
+
+            symbols = self.context.symbols
+            try:
+                if lazy and solver == 'fraction-free':
+                    ffsolver = FractionFreeSolver(self._A, Z)
+
+                    def column(m, index):
+                        return ffsolver.unknown(index)[m].subs(symbols)
+                else:
+                    results = self._solve_rhs(Z, solver).subs(symbols)
+
+                    def column(m, index):
+                        return results[index, m]
+            except ValueError:
+                raise ValueError(self._singular_message())
+
+            for m, other in enumerate(others):
+                other._shared_results = partial(column, m + 1)
+            unknown = partial(column, 0)
+
+        Vexprs = {}
         for n in self.nodes:
             index = self._node_index(n)
             if index >= 0:
-                self._Vdict[n] = vtype(results[index], **assumptions).simplify()
+                Vexprs[n] = partial(unknown, index)
+
+        num_nodes = len(self.node_list) - 1
+
+        Iexprs = {}
+        for m, key in enumerate(self.unknown_branch_currents):
+            Iexprs[key] = partial(unknown, m + num_nodes)
+        return Vexprs, Iexprs
+
+    @property
+    def _numeric_var(self):
+        """Return the variable that needs to be specified for numerical
+        analysis; this is None for DC analysis and for AC analysis
+        with a numeric angular frequency."""
+
+        kind = self.kind
+        if kind in ('s', 'ivp'):
+            return ssym
+        elif kind in ('t', 'time'):
+            return tsym
+        elif isinstance(kind, str) and kind[0] == 'n':
+            return omegasym
+        elif isinstance(kind, sym.Symbol):
+            # AC analysis with a symbolic angular frequency, say omega.
+            return kind
+        return None
+
+    def _numeric_value(self, expr, value=None):
+        """Evaluate SymPy expr as a complex number with the transform
+        domain variable replaced by value."""
+
+        expr = sym.sympify(expr)
+        var = self._numeric_var
+        if var is not None and value is not None:
+            expr = expr.subs(var, value)
+        try:
+            return complex(expr)
+        except TypeError:
+            symbols = tuple(str(symbol) for symbol in expr.free_symbols)
+            if symbols == ():
+                raise ValueError('Cannot evaluate %s numerically' % expr)
+            raise ValueError('Undefined symbols %s in %s; all the component'
+                             ' values must be numeric' % (symbols, expr))
+
+    def numeric_solve(self, value=None):
+        """Solve the MNA equations numerically using NumPy or, for large
+        circuits, SciPy's sparse solver.  value is the value of the
+        transform domain variable, i.e., s for Laplace analysis,
+        angular frequency for AC analysis with a symbolic angular
+        frequency or for noise analysis, or t for time-domain
+        analysis.  It is not required for DC analysis or for AC
+        analysis with a numeric angular frequency.
+
+        This is much faster than symbolic analysis but all the
+        component values must be numeric.  A tuple of dictionaries of
+        node voltages and branch currents is returned.  The values
+        are complex unless they are all real."""
+
+        self._stamp()
+
+        if value is not None and self._numeric_var is None:
+            raise ValueError('Cannot specify value for %s analysis' % self.kind)
+
+        N = self._Asparse.shape[0]
+        rows = []
+        cols = []
+        vals = []
+        for (row, col), expr in self._Asparse.items():
+            value1 = self._numeric_value(expr, value)
+            if value1 != 0:
+                rows.append(row)
+                cols.append(col)
+                vals.append(value1)
+
+        Z = np.zeros(N, dtype=complex)
+        for (row, col), expr in self._Zsparse.items():
+            Z[row] = self._numeric_value(expr, value)
+
+        try:
+            if N < config.numeric_sparse_size:
+                A = np.zeros((N, N), dtype=complex)
+                # Use add.at in case of repeated indices.
+                np.add.at(A, (rows, cols), vals)
+                results = np.linalg.solve(A, Z)
             else:
-                self._Vdict[n] = vtype(0, **assumptions)
+                from scipy.sparse import csc_matrix
+                from scipy.sparse.linalg import spsolve
+
+                A = csc_matrix((vals, (rows, cols)), shape=(N, N))
+                results = spsolve(A, Z)
+        except np.linalg.LinAlgError:
+            raise ValueError(self._singular_message())
+        if not np.all(np.isfinite(results)):
+            raise ValueError(self._singular_message())
+
+        if np.allclose(results.imag, 0.0):
+            results = results.real
+        results = results.tolist()
+
+        Vdict = Nodedict()
+        Vdict['0'] = 0.0
+        for n in self.nodes:
+            index = self._node_index(n)
+            Vdict[n] = results[index] if index >= 0 else 0.0
 
         num_nodes = len(self.node_list) - 1
 
-        # Create dictionary of branch currents through elements
-        self._Idict = Branchdict()
+        Idict = Branchdict()
         for m, key in enumerate(self.unknown_branch_currents):
-            self._Idict[key] = itype(results[m + num_nodes], **assumptions).simplify()
+            Idict[key] = results[m + num_nodes]
 
-        # Calculate the branch currents.  These should be lazily
-        # evaluated as required.
         for elt in self.elements.values():
             if elt.type in ('R', 'C'):
-                n1 = self.node_map[elt.nodes[0]]
-                n2 = self.node_map[elt.nodes[1]]                
-                V1, V2 = self._Vdict[n1], self._Vdict[n2]
-                I = (V1.expr - V2.expr) / elt.Z.expr
-                self._Idict[elt.name] = itype(I, **assumptions).simplify()
+                if elt.type == 'C' and self.kind == 'dc':
+                    Y = 0
+                else:
+                    Y = self._numeric_value(elt.Y.expr, value)
+                V1 = Vdict[self.node_map[elt.nodes[0]]]
+                V2 = Vdict[self.node_map[elt.nodes[1]]]
+                I = (V1 - V2) * Y
             elif elt.type in ('I', ):
-                self._Idict[elt.name] = elt.Isc
+                I = self._numeric_value(elt.Isc.expr, value)
+            else:
+                continue
+            if np.isclose(I.imag, 0.0):
+                I = I.real
+            Idict[elt.name] = I
+
+        return Vdict, Idict
+
+    def _numeric_func(self, expr):
+        """Return function to evaluate SymPy expr as a complex array
+        for an array of values of the transform domain variable."""
+
+        expr = sym.sympify(expr)
+        var = self._numeric_var
+        symbols = tuple(str(symbol) for symbol in expr.free_symbols
+                        if symbol != var)
+        if symbols != ():
+            raise ValueError('Undefined symbols %s in %s; all the component'
+                             ' values must be numeric' % (symbols, expr))
+        func = lambdify(var, expr, 'numpy')
+
+        def evaluate(values):
+            result = np.asarray(func(values), dtype=complex)
+            return np.broadcast_to(result, values.shape)
+        return evaluate
+
+    def _sweep_decompose(self):
+        """Decompose the A matrix into numerical coefficient matrices for
+        each power of the transform domain variable.  Entries that
+        are not polynomials in the variable are evaluated separately."""
+
+        if hasattr(self, '_sweep_coeffs'):
+            return self._sweep_coeffs
+
+        self._stamp()
+        var = self._numeric_var
+        N = self._Asparse.shape[0]
+
+        coeffs = {}
+        others = []
+        for (row, col), expr in self._Asparse.items():
+            expr = sym.sympify(expr)
+            try:
+                poly = sym.Poly(expr, var)
+            except sym.PolynomialError:
+                others.append((row, col, self._numeric_func(expr)))
+                continue
 
-        self.context.restore()
+            for (power, ), coeff in poly.terms():
+                if power not in coeffs:
+                    coeffs[power] = np.zeros((N, N), dtype=complex)
+                coeffs[power][row, col] += self._numeric_value(coeff)
+
+        Zfuncs = [(row, self._numeric_func(expr))
+                  for (row, col), expr in self._Zsparse.items()]
+
+        self._sweep_coeffs = coeffs, others, Zfuncs
+        return self._sweep_coeffs
+
+    def numeric_sweep(self, values):
+        """Solve the MNA equations numerically for an array of values of
+        the transform domain variable (s for Laplace analysis).  The
+        stamps are only evaluated once; the equations for all the
+        values are then solved as a batch.  An array of shape
+        (len(values), number of unknowns) is returned."""
+
+        if self._numeric_var is None:
+            raise ValueError('Cannot sweep for %s analysis' % self.kind)
+
+        coeffs, others, Zfuncs = self._sweep_decompose()
+        values = np.atleast_1d(np.asarray(values, dtype=complex))
+
+        N = self._Asparse.shape[0]
+        Z = np.zeros((len(values), N), dtype=complex)
+        for row, func in Zfuncs:
+            Z[:, row] = func(values)
+
+        results = np.zeros((len(values), N), dtype=complex)
+
+        # Limit the memory required for the stacked A matrices.
+        chunk = max(1, config.numeric_sweep_size // (N * N))
+        for start in range(0, len(values), chunk):
+            values1 = values[start:start + chunk]
+            A = np.zeros((len(values1), N, N), dtype=complex)
+            for power, coeff in coeffs.items():
+                A += coeff * (values1 ** power)[:, None, None]
+            for row, col, func in others:
+                A[:, row, col] += func(values1)
+            try:
+                results[start:start + chunk] = np.linalg.solve(
+                    A, Z[start:start + chunk, :, None])[..., 0]
+            except np.linalg.LinAlgError:
+                raise ValueError(self._singular_message())
+        return results
+
+    def param_sweep(self, values, params):
+        """Solve the MNA equations numerically for an array of values of
+        the transform domain variable and for every combination of
+        the values of the parameters specified by the dictionary
+        params, say {'R1': R1values, 'C1': C1values}.  Each entry of
+        the A matrix and Z vector is converted to a function of the
+        variable and the parameters once.  An array of shape
+        (len(R1values), len(C1values), len(values), number of
+        unknowns) is returned."""
+
+        from .paramsweep import mna_sweep
+
+        if self._numeric_var is None:
+            raise ValueError('Cannot sweep for %s analysis' % self.kind)
+
+        self._stamp()
+        Aitems = [(key, sym.sympify(expr))
+                  for key, expr in self._Asparse.items()]
+        Zitems = [(key, sym.sympify(expr))
+                  for key, expr in self._Zsparse.items()]
+        try:
+            return mna_sweep(Aitems, Zitems, self._Asparse.shape[0],
+                             self._numeric_var, values, params)
+        except np.linalg.LinAlgError:
+            raise ValueError(self._singular_message())
+
+    def sweep(self, name, svector, quantity='V', params=None):
+        """Evaluate voltage of node, or voltage across component, with
+        specified name for an array of s values.  If quantity is 'I',
+        the current through the component is evaluated; a ValueError
+        is raised if this cannot be determined, say for K.  If params
+        is specified, the result is found for every combination of
+        the parameter values; see param_sweep."""
+
+        if isinstance(name, int):
+            name = '%d' % name
+
+        svector = np.atleast_1d(np.asarray(svector, dtype=complex))
+        if params is None:
+            results = self.numeric_sweep(svector)
+
+            def evaluate(expr):
+                return self._numeric_func(expr)(svector)
+        else:
+            from .paramsweep import expr_sweep
+
+            results = self.param_sweep(svector, params)
+
+            def evaluate(expr):
+                return expr_sweep(sym.sympify(expr), self._numeric_var,
+                                  svector, params)
+
+        shape = results.shape[:-1]
+        num_nodes = len(self.node_list) - 1
+
+        def voltage(node):
+            index = self._node_index(node)
+            if index < 0:
+                return np.zeros(shape, dtype=complex)
+            return results[..., index]
+
+        if name in self.nodes:
+            if quantity != 'V':
+                raise ValueError('Can only determine voltage of node %s' % name)
+            return voltage(name)
+
+        if name not in self.elements:
+            raise ValueError('Unknown element or node name %s' % name)
+
+        elt = self.elements[name]
+        V = voltage(elt.nodes[0]) - voltage(elt.nodes[1])
+        if quantity == 'V':
+            return V
+        elif quantity != 'I':
+            raise ValueError('Unknown quantity %s, expecting V or I' % quantity)
+
+        def current(name):
+            return results[..., self._branch_index(name) + num_nodes]
+
+        if name in self.unknown_branch_currents:
+            return current(name)
+        elif elt.type in ('R', 'C', 'Y', 'Z'):
+            return V * evaluate(elt.Y.expr)
+        elif elt.type in ('I', ):
+            return np.broadcast_to(evaluate(elt.Isc.expr), shape)
+        elif elt.type in ('F', ):
+            # See the stamp for F.
+            return -evaluate(cExpr(elt.args[1]).expr) * current(elt.args[0])
+        elif elt.type in ('G', ):
+            # See the stamp for G.
+            Vc = voltage(elt.nodes[2]) - voltage(elt.nodes[3])
+            return -evaluate(cExpr(elt.args[0]).expr) * Vc
+        elif elt.type in ('O', 'P'):
+            return np.zeros(shape, dtype=complex)
+        raise ValueError('Cannot determine current through %s' % name)
 
     @property
     def A(self):
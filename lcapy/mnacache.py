@@ -0,0 +1,138 @@
+"""This module provides an on-disk cache of the node voltages and
+branch currents found by modified nodal analysis.  It is used by the
+MNA class when `config.mna_cache_dir` is not None.
+
+Each entry is a pickled dictionary of SymPy srepr strings, keyed by a
+hash of the netlist, the node map, the analysis kind, the solver, the
+simplification level, and the Lcapy and SymPy versions.  The least
+recently used entries are removed when the total size of the cache
+exceeds `config.mna_cache_size` bytes.
+
+Copyright 2019 Michael Hayes, UCECE
+
+"""
+
+from __future__ import division
+from . import config
+import hashlib
+import os
+import pickle
+import sympy as sym
+
+
+_namespace = {}
+exec('from sympy import *', _namespace)
+
+
+def cache_key(netlist, node_map, kind, solver, simplify_level):
+    """Return a hash for the solved netlist."""
+
+    from . import __version__
+
+    nodes = sorted((str(key), str(value)) for key, value in node_map.items())
+    text = '\n'.join((netlist, repr(nodes), repr(kind), repr(solver),
+                      repr(simplify_level), __version__, sym.__version__))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _filename(key):
+
+    return os.path.join(config.mna_cache_dir, key + '.pkl')
+
+
+def cache_load(key):
+    """Return tuple of dictionaries (Vexprs, Iexprs) of SymPy
+    expressions for the cache entry `key` or None if there is no valid
+    entry."""
+
+    if config.mna_cache_dir is None:
+        return None
+
+    filename = _filename(key)
+    try:
+        with open(filename, 'rb') as f:
+            data = pickle.load(f)
+        results = []
+        for exprs in data:
+            results.append(dict((name, eval(value, _namespace))
+                                for name, value in exprs.items()))
+    except Exception:
+        # Missing, partially written, or stale entry.
+        return None
+
+    try:
+        # Mark as most recently used.
+        os.utime(filename, None)
+    except OSError:
+        pass
+    return tuple(results)
+
+
+def cache_store(key, Vexprs, Iexprs):
+    """Store dictionaries of SymPy expressions for the node voltages
+    and the branch currents."""
+
+    if config.mna_cache_dir is None:
+        return
+
+    data = tuple(dict((name, sym.srepr(expr)) for name, expr in exprs.items())
+                 for exprs in (Vexprs, Iexprs))
+
+    try:
+        if not os.path.isdir(config.mna_cache_dir):
+            os.makedirs(config.mna_cache_dir)
+        filename = _filename(key)
+        # Write to a temporary file so that a reader never sees a
+        # partially written entry.
+        tmpname = '%s.%d.tmp' % (filename, os.getpid())
+        with open(tmpname, 'wb') as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, filename)
+    except OSError:
+        return
+
+    cache_prune()
+
+
+def cache_prune(size=None):
+    """Remove the least recently used entries until the total size of
+    the cache does not exceed `size` bytes.  The default size is
+    `config.mna_cache_size`."""
+
+    if config.mna_cache_dir is None:
+        return
+    if size is None:
+        size = config.mna_cache_size
+
+    entries = []
+    total = 0
+    try:
+        names = os.listdir(config.mna_cache_dir)
+    except OSError:
+        return
+    for name in names:
+        if not name.endswith('.pkl'):
+            continue
+        filename = os.path.join(config.mna_cache_dir, name)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, filename))
+        total += stat.st_size
+
+    entries.sort()
+    for mtime, nbytes, filename in entries:
+        if total <= size:
+            break
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+        total -= nbytes
+
+
+def cache_clear():
+    """Remove all the entries from the cache."""
+
+    cache_prune(0)
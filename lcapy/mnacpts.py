@@ -13,6 +13,7 @@ from .symbols import j, omega, jomega
 from .functions import sqrt
 from .sym import capitalize_name, omegasym
 from .grammar import delimiters
+from copy import copy
 import lcapy
 import inspect
 import sys
@@ -127,12 +128,27 @@ class Cpt(object):
         """Make copy of net."""
         
         return str(self)
-    
+
+    def _copy(self, cct):
+        """Make copy of component for netlist cct.  This avoids
+        converting the component to a string and parsing it; the
+        SymPy values are shared since they are immutable."""
+
+        new = copy(self)
+        new.cct = cct
+        return new
+
     def kill_initial(self):
         """Kill implicit sources due to initial conditions."""
 
         return self.copy()
 
+    def _kill_initial(self, cct):
+        """Kill implicit sources due to initial conditions, returning
+        a component for netlist cct or a net string."""
+
+        return self._copy(cct)
+
     def kill(self):
         """Kill component."""
 
@@ -168,6 +184,20 @@ class Cpt(object):
 
         return self.netmake(node_map)
 
+    def _rename_nodes(self, cct, node_map):
+        """Rename the nodes using dictionary node_map, returning a
+        component for netlist cct or a net string."""
+
+        net = self.netmake(node_map)
+        if self.namespace != '' or self.type == 'K':
+            return net
+
+        new = self._copy(cct)
+        new.net = net.split(';')[0]
+        new.nodes = tuple(node_map[node] for node in self.nodes)
+        new.relnodes = new.nodes
+        return new
+
     def select(self, kind=None):
         """Select domain kind for component."""
 
@@ -509,6 +539,14 @@ class C(RC):
             self.name, self.relnodes[0], self.relnodes[1],
             arg_format(self.args[0]), self.opts)
 
+    def _kill_initial(self, cct):
+        """Kill implicit sources due to initial conditions, returning
+        a component for netlist cct or a net string."""
+
+        if self.cpt.hasic:
+            return self.kill_initial()
+        return self._copy(cct)
+
     def pre_initial_model(self):
 
         if self.cpt.v0 == 0.0:
@@ -761,6 +799,14 @@ class L(RLC):
             self.name, self.relnodes[0], self.relnodes[1],
             arg_format(self.args[0]), self.opts)
 
+    def _kill_initial(self, cct):
+        """Kill implicit sources due to initial conditions, returning
+        a component for netlist cct or a net string."""
+
+        if self.cpt.hasic:
+            return self.kill_initial()
+        return self._copy(cct)
+
     def stamp(self, cct):
 
         # This formulation adds the inductor current to the unknowns
@@ -1,11 +1,11 @@
 from . import grammar
-from .parser import Parser
+from .parser import get_parser
 
 
 class NetfileMixin(object):
 
     def _init_parser(self, cpts):
-        self.parser = Parser(cpts, grammar)
+        self.parser = get_parser(cpts, grammar)
         # Current namespace
         self.namespace = ''
         self.subnetlists = {}
@@ -87,24 +87,62 @@ class NetfileMixin(object):
 
         string = string.strip()
         if '\n' in string:
-            lines = string.split('\n')
-            for line in lines:
-                self._add(line.strip(), namespace)
+            self._lines_add(string.split('\n'), namespace)
             return
 
         cpt = self._parse(string, namespace)
         if cpt is not None:
             self._cpt_add(cpt)
 
-    def _netfile_add(self, filename, namespace=''):
+    def _lines_add(self, lines, namespace='', source=None, progress=None):
+        """Add the nets from an iterable of lines.  Errors are reported
+        with the line number and the name of the source, if known.  If
+        progress is not None, it is called with the line number after
+        each line is added."""
+
+        for lineno, line in enumerate(lines, 1):
+            try:
+                cpt = self._parse(line.strip(), namespace)
+            except ValueError as e:
+                where = 'line %d' % lineno
+                if source is not None:
+                    where = '%s %s' % (source, where)
+                raise ValueError('%s: %s' % (where, e))
+
+            if cpt is not None:
+                self._cpt_add(cpt)
+            if progress is not None:
+                progress(lineno)
+
+    def _netfile_add(self, filename, namespace='', progress=None):
         """Add the nets from file with specified filename"""
 
         try:
             file = open(filename, 'r')
         except:
-            file = open(filename + '.sch', 'r')            
+            filename += '.sch'
+            file = open(filename, 'r')
+
+        with file:
+            self._lines_add(file, namespace, filename, progress)
+
+    def bulk_add(self, source, progress=None):
+        """Add the nets from source in a single pass.  This is faster
+        than calling add for each net since the cached analysis is
+        only invalidated once.  source can be a filename, a file
+        object, or an iterable of lines.  For example:
 
-        lines = file.readlines()
+        cct.bulk_add('filter.sch')
+        cct.bulk_add(open('filter.sch'))
+        cct.bulk_add(['R1 1 2', 'C1 2 0'])
 
-        for line in lines:
-            self._add(line, namespace)
+        Errors are reported with the line number.  If progress is not
+        None, it is called with the line number after each line is
+        added."""
+
+        if isinstance(source, str):
+            self._netfile_add(source, self.namespace, progress)
+        else:
+            self._lines_add(source, self.namespace,
+                            getattr(source, 'name', None), progress)
+        self._invalidate()
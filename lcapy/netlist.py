@@ -20,6 +20,7 @@ from .netfile import NetfileMixin
 from . import mnacpts
 from copy import copy
 from collections import OrderedDict
+import sympy as sym
 
 
 class Node(object):
@@ -56,6 +57,52 @@ class Node(object):
         self.list.append(cpt)
 
 
+class UnionFind(object):
+    """Disjoint sets of nodes, where the nodes in each set are
+    connected by wires."""
+
+    def __init__(self):
+
+        # Parent of each node; the root of each set is its own parent.
+        self.parent = OrderedDict()
+
+    def add(self, node):
+
+        if node not in self.parent:
+            self.parent[node] = node
+
+    def find(self, node):
+        """Return root node of the set containing node."""
+
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression.
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def union(self, node1, node2):
+        """Merge the sets containing node1 and node2.  The root of the
+        set containing node1 is the root of the merged set."""
+
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 != root2:
+            self.parent[root2] = root1
+
+    def sets(self):
+        """Return dictionary of lists of nodes keyed by the root nodes,
+        in the order the root nodes were added."""
+
+        sets = OrderedDict((node, []) for node, parent in self.parent.items()
+                           if node == parent)
+        for node in self.parent:
+            sets[self.find(node)].append(node)
+        return sets
+
+
 class SubNetlist(object):
 
     def __init__(self, namespace, netlist):
@@ -172,14 +219,24 @@ class SubNetlist(object):
         
 class NetlistMixin(object):
 
-    def __init__(self, filename=None, context=None):
+    def __init__(self, filename=None, context=None, solver=None,
+                 simplify_level=None):
 
         self._elements = OrderedDict()
         self.nodes = {}
+        # Nodes connected by wires; this is updated as components are
+        # added and recreated if components are removed.
+        self._enodes = UnionFind()
         if context is None:
             context = global_context.new()
         
         self.context = context
+        # Method for solving the MNA equations; if None, the default
+        # specified by config.mna_solver is used.
+        self.solver = solver
+        # Simplification of the MNA results; if None, the default
+        # specified by config.mna_simplify_level is used.
+        self.simplify_level = simplify_level
         self._init_parser(mnacpts)
 
         self.opts = SchematicOpts()
@@ -257,6 +314,7 @@ class NetlistMixin(object):
             # Need to search lists and update component.
             # For example, remove nodes that are only connected
             # to this component.
+            self._enodes = None
         else:
             # Check that this name won't conflict with an attr.
             # For example, cannot have name V or I.  Perhaps
@@ -269,6 +327,21 @@ class NetlistMixin(object):
         for node in cpt.nodes:
             self._node_add(node, cpt)
 
+        if self._enodes is not None:
+            for node in cpt.nodes:
+                self._enodes.add(node)
+            if cpt.type == 'W':
+                self._enodes.union(*cpt.nodes)
+
+    def _net_add(self, net):
+        """Add component; net is either a component object or a net
+        string that needs to be parsed."""
+
+        if isinstance(net, str):
+            self._add(net)
+        else:
+            self._cpt_add(net)
+
     def copy(self):
         """Create a copy of the netlist"""
 
@@ -276,7 +349,7 @@ class NetlistMixin(object):
         new.opts = copy(self.opts)
 
         for cpt in self._elements.values():
-            new._add(cpt.copy())
+            new._cpt_add(cpt._copy(new))
         return new        
 
     def _new(self):
@@ -286,9 +359,16 @@ class NetlistMixin(object):
         # TODO.  Copy or share?
         context = self.context
         if self.__class__ == 'Circuit':
-            return Circuit(context=context)
-        # If have OnePort, Network, etc., treat as Netlist
-        return Netlist(context=context)
+            new = Circuit(context=context, solver=self.solver,
+                          simplify_level=self.simplify_level)
+        else:
+            # If have OnePort, Network, etc., treat as Netlist
+            new = Netlist(context=context, solver=self.solver,
+                          simplify_level=self.simplify_level)
+        # Components copied without parsing keep their anonymous
+        # names so avoid reusing these names.
+        new._anon = self._anon.copy()
+        return new
 
     def remove(self, name):
         """Remove specified element."""
@@ -298,6 +378,7 @@ class NetlistMixin(object):
         if name not in self._elements:
             raise ValueError('Unknown component: ' + name)
         self._elements.pop(name)
+        self._enodes = None
         # TODO, remove nodes that are only connected
         # to this component.
 
@@ -307,27 +388,15 @@ class NetlistMixin(object):
         This returns a dictionary keyed by the unique node names with
         values being lists of nodes of the same potential."""
 
-        enodes = {}
-        for key in self.nodes.keys():
-            enodes[key] = [key]
-
-        # Then augment with nodes connected by wires.
-        for m, elt in enumerate(self.elements.values()):
-            if elt.type not in ('W', ):
-                continue
-
-            n1, n2 = elt.nodes
-
-            for key1, nodes in enodes.items():
-                if n1 in nodes:
-                    break
-
-            for key2, nodes in enodes.items():
-                if n2 in nodes:
-                    break
-
-            if key1 != key2:
-                enodes[key1].extend(enodes.pop(key2))
+        if self._enodes is None:
+            enodes = UnionFind()
+            for node in self.nodes:
+                enodes.add(node)
+            for elt in self.elements.values():
+                if elt.type == 'W':
+                    enodes.union(*elt.nodes)
+            self._enodes = enodes
+        enodes = self._enodes.sets()
 
         # Alter keys to avoid underscore and to ensure that have a '0'
         # key if possible.
@@ -401,7 +470,7 @@ class NetlistMixin(object):
         new.opts = copy(self.opts)
 
         for cpt in self._elements.values():
-            new._add(cpt.rename_nodes(node_map))
+            new._net_add(cpt._rename_nodes(new, node_map))
         return new                
 
         
@@ -416,6 +485,16 @@ class NetlistMixin(object):
 
         return self.Voc(Np, Nm).time()
 
+    def _port_impedances(self, *ports):
+        """Return matrix of the s-domain transfer impedances between the
+        ports specified by node pairs (Np, Nm), with the independent
+        sources killed.  The analysis of the killed netlist is reused
+        for each set of ports."""
+
+        if not hasattr(self, '_ports'):
+            self._ports = GroupNetlist(self.kill(), [], 's')
+        return self._ports._solve_ports(ports)
+
     def Isc(self, Np, Nm):
         """Return short-circuit transform-domain current between nodes Np and
         Nm."""
@@ -458,6 +537,13 @@ class NetlistMixin(object):
 
         """
 
+        try:
+            Z = self._port_impedances((Np, Nm))[0, 0]
+        except (ValueError, KeyError):
+            Z = 0
+        if Z != 0:
+            return Ys(Ys(1 / Z).canonical(), causal=True)
+
         new = self.kill()
 
         # Connect 1 V s-domain voltage source between nodes and
@@ -474,6 +560,12 @@ class NetlistMixin(object):
 
         """
 
+        try:
+            Z = self._port_impedances((Np, Nm))[0, 0]
+            return Zs(Zs(Z).canonical(), causal=True)
+        except (ValueError, KeyError):
+            pass
+
         new = self.kill()
 
         # Connect 1 A s-domain current source between nodes and
@@ -525,6 +617,14 @@ class NetlistMixin(object):
 
         # TODO, work with AC models
 
+        # V2 / V1 = Z21 / Z11 for a current applied to port 1.
+        try:
+            Z = self._port_impedances((N1p, N1m), (N2p, N2m))
+        except (ValueError, KeyError):
+            Z = sym.zeros(2, 2)
+        if Z[0, 0] != 0:
+            return Hs(Hs(Z[1, 0] / Z[0, 0]).canonical(), causal=True)
+
         new = self.kill()
         new._add('V1_ %d %d {DiracDelta(t)}' % (N1p, N1m))
 
@@ -546,6 +646,20 @@ class NetlistMixin(object):
         if self.Voc(N1p, N1m) != 0 or self.Voc(N2p, N2m) != 0:
             raise ValueError('Network contains independent sources')
 
+        # Convert from the impedance parameters if they exist.  The
+        # signs of A21 and A22 follow the convention below, where I1
+        # is the current of the source applied to port 1.
+        try:
+            Z = self._port_impedances((N1p, N1m), (N2p, N2m))
+        except (ValueError, KeyError):
+            Z = sym.zeros(2, 2)
+        if Z[1, 0] != 0:
+            Z21 = Z[1, 0]
+            return AMatrix(Hs(sym.cancel(Z[0, 0] / Z21)),
+                           Zs(sym.cancel(Z.det() / Z21)),
+                           Ys(sym.cancel(-1 / Z21)),
+                           Hs(sym.cancel(-Z[1, 1] / Z21)))
+
         try:
             self.add('V1_ %d %d {DiracDelta(t)}' % (N1p, N1m))
 
@@ -589,10 +703,10 @@ class NetlistMixin(object):
             elif cpt.independent_source:
                 net = cpt.zero()
             elif kind != 'ivp':
-                net = cpt.kill_initial()
+                net = cpt._kill_initial(new)
             else:
-                net = cpt.copy()
-            new._add(net)
+                net = cpt._copy(new)
+            new._net_add(net)
         return new        
 
     def _kill(self, sourcenames):
@@ -606,10 +720,10 @@ class NetlistMixin(object):
             elif cpt.name in sourcenames:
                 net = cpt.kill()
             elif 'ICs' in sourcenames:
-                net = cpt.kill_initial()
+                net = cpt._kill_initial(new)
             else:
-                net = cpt.copy()
-            new._add(net)
+                net = cpt._copy(new)
+            new._net_add(net)
         return new        
 
     def kill_except(self, *args):
@@ -664,8 +778,8 @@ class NetlistMixin(object):
             if cpt.name in resistornames:
                 net = cpt.noisy()
             else:
-                net = cpt.copy()
-            new._add(net)
+                net = cpt._copy(new)
+            new._net_add(net)
         return new        
 
     def noisy_except(self, *args):
@@ -1034,16 +1148,18 @@ class Netlist(NetlistMixin, NetfileMixin):
 
     """
 
-    def __init__(self, filename=None, context=None):
+    def __init__(self, filename=None, context=None, solver=None,
+                 simplify_level=None):
 
-        super (Netlist, self).__init__(filename, context)
+        super (Netlist, self).__init__(filename, context, solver,
+                                       simplify_level)
         self._invalidate()
         self.kind = 'super'
 
     def _invalidate(self):
 
         for attr in ('_sch', '_sub', '_Vdict', '_Idict', '_analysis',
-                     '_node_map'):
+                     '_node_map', '_ports'):
             try:
                 delattr(self, attr)
             except:
@@ -1100,6 +1216,11 @@ class Netlist(NetlistMixin, NetfileMixin):
         for key, sources in groups.items():
             self._sub[key] = GroupNetlist(self, sources, key)
 
+        # The sub-netlists with the same MNA A matrix, say for
+        # different noise sources, are solved together.
+        for subnetlist in self._sub.values():
+            subnetlist._siblings = self._sub
+
         return self._sub
 
     @property
@@ -1179,6 +1300,76 @@ class Netlist(NetlistMixin, NetfileMixin):
 
         return self.get_Vd(Np, Nm).time()
 
+    def numeric_solve(self, kind=None, value=None):
+        """Numerically solve the sub-circuit for transform domain kind
+        ('dc', 's', angular frequency for AC, etc.).  If kind is None,
+        there must only be a single kind of independent source.  value
+        is the value of s for Laplace analysis or the angular
+        frequency for AC analysis, when this is symbolic, or for noise
+        analysis.
+
+        All the component values must be numeric.  A tuple of
+        dictionaries of node voltages and branch currents is
+        returned.  For example,
+
+        >>> Vdict, Idict = cct.numeric_solve('dc')
+        >>> Vdict['2']"""
+
+        if kind is None:
+            if len(self.sub) != 1:
+                raise ValueError('Need to specify one of kinds %s' % self.kinds)
+            kind = self.kinds[0]
+        elif kind not in self.kinds:
+            raise ValueError('Unknown kind %s, expecting one of %s' %
+                             (kind, self.kinds))
+        return self.sub[kind].numeric_solve(value)
+
+    def sweep(self, name, fvector, quantity='V', params=None):
+        """Evaluate the frequency response of the node voltage or
+        component voltage for node or component name at the
+        frequencies (in Hz) in the array fvector.  If quantity is
+        'I', the current through the component is evaluated.  A
+        complex NumPy array is returned.
+
+        This solves the MNA equations for the Laplace (s-domain)
+        sub-circuit numerically for all the frequencies in a single
+        batch and is much faster than substituting s = j * 2 * pi * f
+        into the symbolic result.  All the component values must be
+        numeric.  For example,
+
+        >>> cct = Circuit()
+        >>> cct.add('V1 1 0 {DiracDelta(t)}')
+        >>> cct.add('R1 1 2 1e3')
+        >>> cct.add('C1 2 0 1e-6')
+        >>> H = cct.sweep(2, np.logspace(0, 5, 1000))
+
+        Component values, or other symbols, can be swept by
+        specifying a dictionary of arrays of their values with
+        params.  The result then has an axis for each parameter,
+        followed by an axis for the frequency.  For example,
+
+        >>> cct = Circuit()
+        >>> cct.add('V1 1 0 {DiracDelta(t)}')
+        >>> cct.add('R1 1 2')
+        >>> cct.add('C1 2 0 1e-6')
+        >>> H = cct.sweep(2, f, params={'R1': [1e3, 2e3, 5e3]})
+        >>> H.shape
+        (3, 1000)"""
+
+        import numpy as np
+
+        kinds = self.kinds
+        if 'ivp' in kinds:
+            kind = 'ivp'
+        elif 's' in kinds:
+            kind = 's'
+        else:
+            raise ValueError('Circuit has no transient (s-domain) sources;'
+                             ' kinds are %s' % kinds)
+
+        svector = 2j * np.pi * np.asarray(fvector)
+        return self.sub[kind].sweep(name, svector, quantity, params)
+
     
 class GroupNetlist(NetlistMixin, MNA):
 
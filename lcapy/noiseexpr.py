@@ -39,6 +39,9 @@ class noiseExpr(omegaExpr):
     (Vsuper(a) + Vsuper(b) - Vsuper(b)).n gives 3 as expected.
 
     """
+
+    __slots__ = ()
+
     one_sided = True
 
     def _new_nid(self):
@@ -192,8 +195,8 @@ class noiseExpr(omegaExpr):
         
         # Hack so show as linear frequency. 
         obj = self.subs(omega, 2 * pi * omega)
-        obj.domain_name = 'Frequency'
-        obj.domain_units = 'Hz'
+        obj._domain_name = 'Frequency'
+        obj._domain_units = 'Hz'
         if hasattr(self, 'part'):
             obj.part = self.part
         return plot_frequency(obj, fvector, **kwargs)    
@@ -207,6 +210,8 @@ class Vn(noiseExpr):
     
     """
 
+    __slots__ = ()
+
     quantity = 'Voltage noise spectral density'
     units = 'V/rtHz'
 
@@ -227,6 +232,8 @@ class In(noiseExpr):
     i = In(3e-12 / sqrt(omega) + 200e-15)
     """
 
+    __slots__ = ()
+
     quantity = 'Current noise spectral density'
     units = 'A/rtHz'
 
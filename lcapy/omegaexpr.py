@@ -8,6 +8,8 @@ class omegaExpr(sfwExpr):
 
     """Fourier domain expression or symbol (angular frequency)."""
 
+    __slots__ = ()
+
     var = omegasym
     domain_name = 'Angular frequency'
     domain_units = 'rad/s'
@@ -18,10 +20,10 @@ class omegaExpr(sfwExpr):
         super(omegaExpr, self).__init__(val, **assumptions)
         self._fourier_conjugate_class = tExpr
 
-        if self.expr.find(ssym) != set():
+        if ssym in self.expr.free_symbols:
             raise ValueError(
                 'omega-domain expression %s cannot depend on s' % self.expr)
-        if self.expr.find(tsym) != set():
+        if tsym in self.expr.free_symbols:
             raise ValueError(
                 'omega-domain expression %s cannot depend on t' % self.expr)
 
@@ -63,6 +65,8 @@ class Yomega(omegaExpr):
 
     """omega-domain admittance."""
 
+    __slots__ = ()
+
     quantity = 'Admittance'
     units = 'siemens'
 
@@ -94,6 +98,8 @@ class Zomega(omegaExpr):
 
     """omega-domain impedance."""
 
+    __slots__ = ()
+
     quantity = 'Impedance'
     units = 'ohms'
 
@@ -125,6 +131,8 @@ class Vomega(omegaExpr):
 
     """omega-domain voltage (units V/rad/s)."""
 
+    __slots__ = ()
+
     quantity = 'Voltage spectrum'
     units = 'V/rad/s'
 
@@ -138,6 +146,8 @@ class Iomega(omegaExpr):
 
     """omega-domain current (units A/rad/s)."""
 
+    __slots__ = ()
+
     quantity = 'Current spectrum'
     units = 'A/rad/s'
 
@@ -151,6 +161,8 @@ class Homega(omegaExpr):
 
     """omega-domain transfer function response."""
 
+    __slots__ = ()
+
     quantity = 'Transfer function'
     units = ''
 
@@ -306,6 +306,71 @@ class OnePort(Network):
         return self
 
     
+def _source(source):
+    """Return source (Voc or Isc) decomposed into DC and transient
+    components, or None if it has AC or noise components since these
+    cannot be transformed by an impedance."""
+
+    source = source.decompose()
+    if any(kind not in ('dc', 's') for kind in source.keys()):
+        return None
+    return source
+
+
+def _model(arg):
+    """Return the Thevenin or Norton model of a one-port; see
+    ParSer._reduce."""
+
+    if isinstance(arg, ParSer):
+        return arg._reduce()
+    if arg.current_source:
+        return 'Y', Ys(0), _source(arg.Isc)
+    if arg.voltage_source:
+        return 'Z', Zs(0), _source(arg.Voc)
+    return 'Z', arg.Z, _source(arg.Voc)
+
+
+def _thevenin(model):
+    """Return tuple (Z, Voc) for a Thevenin or Norton model or None
+    if Z is infinite."""
+
+    kind, value, source = model
+    if kind == 'Z':
+        return value, source
+    if value == 0:
+        return None
+    Z = Zs(Zs(1 / value).canonical())
+    if source is not None:
+        source = source * Z
+    return Z, source
+
+
+def _norton(model):
+    """Return tuple (Y, Isc) for a Thevenin or Norton model or None
+    if Y is infinite."""
+
+    kind, value, source = model
+    if kind == 'Y':
+        return value, source
+    if value == 0:
+        return None
+    Y = Ys(Ys(1 / value).canonical())
+    if source is not None:
+        source = source * Y
+    return Y, source
+
+
+def _finite(model):
+    """Return False if a model has infinite or undefined values, say
+    from the DC component of the short-circuit current of a voltage
+    source in series with an inductor."""
+
+    exprs = [model[1].expr]
+    if model[2] is not None:
+        exprs += [value.expr for value in model[2].values()]
+    return not any(expr.has(sym.zoo, sym.oo, sym.nan) for expr in exprs)
+
+
 class ParSer(OnePort):
     """Parallel/serial class"""
 
@@ -536,29 +601,83 @@ class ParSer(OnePort):
         args = [arg.noise_model() for arg in self.args]
         return (self.__class__(*args))
 
+    def _reduce(self):
+        """Return the Thevenin model ('Z', Z, Voc) or, if Z is infinite,
+        the Norton model ('Y', Y, Isc) found by series/parallel
+        reduction of the args.  This is memoized for each
+        sub-network.  None is returned if the network cannot be
+        reduced, say for a current source in series with an
+        impedance; modified nodal analysis is then required.  Voc
+        (or Isc) is None if the network has AC or noise sources."""
+
+        try:
+            return self._reduced
+        except AttributeError:
+            pass
+
+        try:
+            model = self._reduce_args()
+        except (TypeError, ValueError):
+            model = None
+        if model is not None and not _finite(model):
+            model = None
+        self._reduced = model
+        return model
+
     @property
     def Isc(self):
-        return self.cct.Isc(1, 0)
+        model = self._reduce()
+        if (model is None or model[2] is None or
+            (model[0] == 'Z' and model[1] == 0)):
+            return self.cct.Isc(1, 0)
+        return _norton(model)[1].canonical()
 
     @property
     def Voc(self):
-        return self.cct.Voc(1, 0)
+        model = self._reduce()
+        if (model is None or model[2] is None or
+            (model[0] == 'Y' and model[1] == 0)):
+            return self.cct.Voc(1, 0)
+        return _thevenin(model)[1].canonical()
 
     @property
     def Y(self):
-        # Could extract directly if have Y || I or Z + V
-        return self.cct.admittance(1, 0)
+        model = self._reduce()
+        if model is None or (model[0] == 'Z' and model[1] == 0):
+            return self.cct.admittance(1, 0)
+        return Ys(_norton(model)[0], causal=True)
 
     @property
     def Z(self):
-        # Could extract directly if have Y || I or Z + V
-        return self.cct.impedance(1, 0)
+        model = self._reduce()
+        if model is None or (model[0] == 'Y' and model[1] == 0):
+            return self.cct.impedance(1, 0)
+        return Zs(_thevenin(model)[0], causal=True)
 
 class Par(ParSer):
     """Parallel class"""
 
     _operator = '|'
 
+    def _reduce_args(self):
+
+        Y = Ys(0)
+        Isc = Isuper()
+        for arg in self.args:
+            model = _model(arg)
+            if model is None:
+                return None
+            model = _norton(model)
+            if model is None:
+                # Have a voltage source in parallel.
+                return None
+            Y += model[0]
+            if Isc is not None and model[1] is not None:
+                Isc += model[1]
+            else:
+                Isc = None
+        return 'Y', Ys(Y.canonical()), Isc
+
     def __init__(self, *args):
 
         _check_oneport_args(args)
@@ -656,6 +775,25 @@ class Ser(ParSer):
 
     _operator = '+'
 
+    def _reduce_args(self):
+
+        Z = Zs(0)
+        Voc = Vsuper()
+        for arg in self.args:
+            model = _model(arg)
+            if model is None:
+                return None
+            model = _thevenin(model)
+            if model is None:
+                # Have a current source in series.
+                return None
+            Z += model[0]
+            if Voc is not None and model[1] is not None:
+                Voc += model[1]
+            else:
+                Voc = None
+        return 'Z', Zs(Z.canonical()), Voc
+
     def __init__(self, *args):
 
         _check_oneport_args(args)
@@ -1158,4 +1296,5 @@ from .noiseexpr import In, Vn
 from .super import Isuper, Vsuper
 from .phasor import Iphasor, Vphasor
 from .twoport import Ladder, LSection, TSection
+import sympy as sym
 
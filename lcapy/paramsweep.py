@@ -0,0 +1,184 @@
+"""This module provides functions for evaluating expressions, and for
+numerically solving the MNA equations, for every combination of the
+values of a number of parameters, say component values, and for an
+array of values of the transform domain variable.
+
+Each expression is only converted to a function once; the parameters
+are passed to this function as extra vectorized arguments.  Grids
+with more than `config.sweep_parallel_size` points are split between
+`config.sweep_processes` processes.
+
+Copyright 2019 Michael Hayes, UCECE
+
+"""
+
+from __future__ import division
+from sympy.utilities.lambdify import lambdify
+from .sym import canonical_name
+from . import config
+import numpy as np
+import sympy as sym
+import os
+
+
+def param_grid(params):
+    """Return the names of the parameters in the dictionary params,
+    the shape of the grid of their values, and a list of flattened
+    arrays of the value of each parameter at every point of the
+    grid."""
+
+    if len(params) == 0:
+        raise ValueError('No parameters to sweep')
+
+    # Symbol names, such as R1, are converted to the canonical form R_1.
+    names = tuple(canonical_name(str(name)) for name in params)
+    arrays = [np.atleast_1d(np.asarray(values)).ravel()
+              for values in params.values()]
+    shape = tuple(len(array) for array in arrays)
+    grids = np.meshgrid(*arrays, indexing='ij')
+    return names, shape, [grid.ravel() for grid in grids]
+
+
+def param_symbols(names, exprs, var=None):
+    """Return tuple of the symbols in the SymPy expressions exprs with
+    the specified names.  A ValueError is raised if the expressions
+    have other symbols, apart from var."""
+
+    symbols = {}
+    for expr in exprs:
+        for symbol in expr.free_symbols:
+            symbols[symbol.name] = symbol
+
+    undefined = set(symbols) - set(names)
+    if var is not None:
+        undefined -= set((var.name, ))
+    if undefined != set():
+        raise ValueError('Undefined symbols %s; these need to be swept'
+                         ' parameters' % (tuple(sorted(undefined)), ))
+
+    return tuple(symbols.get(name, sym.Symbol(name)) for name in names)
+
+
+def _args(values, params):
+    """Return arguments for a function of the transform domain
+    variable and the parameters that broadcast to an array of shape
+    (len(params[n]), len(values)), or (len(params[n]), ) if values is
+    None."""
+
+    if values is None:
+        return list(params)
+    return [values[None, :]] + [param[:, None] for param in params]
+
+
+def _evaluate(func, args):
+    """Return func(*args) as a complex array with the broadcast shape
+    of args."""
+
+    result = np.asarray(func(*args), dtype=complex)
+    return np.broadcast_to(result, np.broadcast(*args).shape)
+
+
+def _expr_solve(expr, symbols, values, params):
+    """Evaluate SymPy expr, where symbols are the transform domain
+    variable (unless values is None) followed by the parameters."""
+
+    from .expr import _lambdify
+
+    return _evaluate(_lambdify(expr, symbols), _args(values, params))
+
+
+def _mna_solve(Aitems, Zitems, N, symbols, values, params):
+    """Solve the MNA equations, with the A matrix and Z vector
+    specified by lists of ((row, col), expr) and ((row, col), expr),
+    for each value of the transform domain variable and for each set
+    of parameters.  An array of shape (len(params[n]), len(values), N)
+    is returned."""
+
+    Afuncs = [(row, col, lambdify(symbols, expr, 'numpy'))
+              for (row, col), expr in Aitems]
+    Zfuncs = [(row, lambdify(symbols, expr, 'numpy'))
+              for (row, col), expr in Zitems]
+
+    P = len(params[0]) if params else 1
+    S = len(values)
+    results = np.zeros((P, S, N), dtype=complex)
+
+    # Limit the memory required for the stacked A matrices.
+    chunk = max(1, config.numeric_sweep_size // (S * N * N))
+    for start in range(0, P, chunk):
+        params1 = [param[start:start + chunk] for param in params]
+        args = _args(values, params1)
+        P1 = len(params1[0]) if params1 else 1
+
+        A = np.zeros((P1, S, N, N), dtype=complex)
+        for row, col, func in Afuncs:
+            A[:, :, row, col] += _evaluate(func, args)
+        Z = np.zeros((P1, S, N, 1), dtype=complex)
+        for row, func in Zfuncs:
+            Z[:, :, row, 0] += _evaluate(func, args)
+
+        results[start:start + chunk] = np.linalg.solve(A, Z)[..., 0]
+    return results
+
+
+def _run(func, fixed, values, params):
+    """Call func(*fixed, values, params), splitting the parameter sets
+    between processes when the grid is large."""
+
+    P = len(params[0]) if params else 1
+    size = P * (1 if values is None else len(values))
+    processes = config.sweep_processes or os.cpu_count() or 1
+
+    if size < config.sweep_parallel_size or processes == 1 or P == 1:
+        return func(*(fixed + (values, params)))
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    futures = []
+    with ProcessPoolExecutor(processes) as executor:
+        for indices in np.array_split(np.arange(P), processes):
+            params1 = [param[indices] for param in params]
+            futures.append(executor.submit(func,
+                                           *(fixed + (values, params1))))
+        return np.concatenate([future.result() for future in futures])
+
+
+def expr_sweep(expr, var, values, params):
+    """Evaluate SymPy expr for each combination of the values of the
+    parameters in the dictionary params and for each value in the
+    array values of var (if var is not None).  An array of shape
+    (len(param1), len(param2), ..., len(values)) is returned."""
+
+    names, shape, grid = param_grid(params)
+    symbols = param_symbols(names, [expr], var)
+    if var is not None:
+        # Use the variable in expr, since it may have different
+        # assumptions.
+        for symbol in expr.free_symbols:
+            if symbol.name == var.name:
+                var = symbol
+        values = np.atleast_1d(np.asarray(values))
+        symbols = (var, ) + symbols
+        shape += (len(values), )
+    else:
+        values = None
+
+    result = _run(_expr_solve, (expr, symbols), values, grid)
+    return result.reshape(shape)
+
+
+def mna_sweep(Aitems, Zitems, N, var, values, params):
+    """Solve the MNA equations for each combination of the values of
+    the parameters in the dictionary params and for each value in
+    the array values of var.  An array of shape (len(param1),
+    len(param2), ..., len(values), N) is returned.  A
+    numpy.linalg.LinAlgError is raised if the A matrix is
+    singular."""
+
+    names, shape, grid = param_grid(params)
+    exprs = [expr for key, expr in Aitems + Zitems]
+    symbols = (var, ) + param_symbols(names, exprs, var)
+    values = np.atleast_1d(np.asarray(values, dtype=complex))
+
+    result = _run(_mna_solve, (Aitems, Zitems, N, symbols), values, grid)
+    return result.reshape(shape + (len(values), N))
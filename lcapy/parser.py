@@ -7,13 +7,25 @@ Copyright 2015, 2016 Michael Hayes, UCECE
 
 import re
 
-# Could use a script to generate parser and parsing tables if speed
-# was important.
+# The parsing tables are built once for each component module and
+# grammar, see get_parser.
+
+_split_patterns = {}
+
 
 def split(s, delimiters):
     """Split string by specified delimiters but not if a delimiter is
     within curly brackets {} or ""."""
 
+    if '{' not in s and '"' not in s:
+        # Fast path when nothing is escaped.
+        try:
+            pattern = _split_patterns[delimiters]
+        except KeyError:
+            pattern = re.compile('[^%s]+' % re.escape(delimiters))
+            _split_patterns[delimiters] = pattern
+        return pattern.findall(s)
+
     parts = []
     current = []
     close_bracket = ''
@@ -191,7 +203,6 @@ class Parser(object):
         if string[0] in self.comments:
             return None
 
-        self.string = string
         fields = string.split(';', 1)
 
         fields = split(fields[0], self.delimiters)
@@ -252,3 +263,17 @@ class Parser(object):
         return self.cpts.make(rule.classname, parent, name,
                               cpt_type, cpt_id, string, opts_string,
                               tuple(nodes), keyword, *args)
+
+
+_parsers = {}
+
+
+def get_parser(cpts, grammar):
+    """Return parser for the components defined by module cpts and the
+    syntax defined by module grammar.  The parser is shared since it
+    has no state that changes when parsing."""
+
+    key = (cpts.__name__, grammar.__name__)
+    if key not in _parsers:
+        _parsers[key] = Parser(cpts, grammar)
+    return _parsers[key]
@@ -9,6 +9,8 @@ from .omegaexpr import omegaExpr
 
 class Phasor(omegaExpr):
 
+    __slots__ = ()
+
     # Could convert Vphasor + Vconst -> VSuper but that is not really
     # the scope for types such as Vphasor and Vconst.
 
@@ -106,6 +108,8 @@ class Phasor(omegaExpr):
 
 class Vphasor(Phasor):
 
+    __slots__ = ()
+
     def __init__(self, val, **assumptions):
 
         super(Vphasor, self).__init__(val, **assumptions)
@@ -118,6 +122,8 @@ class Vphasor(Phasor):
     
 class Iphasor(Phasor):
 
+    __slots__ = ()
+
     def __init__(self, val, **assumptions):
         super(Iphasor, self).__init__(val, **assumptions)
         self._laplace_conjugate_class = It
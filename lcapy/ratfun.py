@@ -6,6 +6,7 @@ Copyright 2016--2019 Michael Hayes, UCECE
 
 from __future__ import division
 import sympy as sym
+import numpy as np
 from sympy.core.mul import _unevaluated_Mul as uMul
 
 
@@ -114,6 +115,46 @@ class Ratfun(object):
     
         return N, D, delay
 
+    def as_residue_parts_numeric(self):
+        """Return residues, poles, direct terms, and delay of expression
+        found numerically using scipy.signal.residue.  This requires
+        that the coefficients of the rational function are numeric.
+
+        The expression is sum_i r[i] / (var - p[i]) ** m[i] plus the
+        polynomial with coefficients k, multiplied by
+        exp(-var * delay).  The multiplicity m[i] of each pole is also
+        returned as a list."""
+
+        from scipy.signal import residue
+
+        N, D, delay = self.as_ratfun_delay()
+
+        try:
+            b = [complex(c) for c in sym.Poly(N, self.var).all_coeffs()]
+            a = [complex(c) for c in sym.Poly(D, self.var).all_coeffs()]
+            delay = float(delay)
+        except TypeError:
+            raise ValueError('Cannot find numeric residues of %s since it'
+                             ' has symbols other than %s' % (self.expr,
+                                                             self.var))
+
+        if np.allclose(np.imag(b), 0) and np.allclose(np.imag(a), 0):
+            b = np.real(b)
+            a = np.real(a)
+
+        r, p, k = residue(b, a)
+
+        # For repeated poles, residue returns the terms for the
+        # increasing powers of 1 / (var - p) consecutively.
+        m = []
+        for i, pole in enumerate(p):
+            if i > 0 and pole == p[i - 1]:
+                m.append(m[-1] + 1)
+            else:
+                m.append(1)
+
+        return r, p, m, k, delay
+
     def roots(self):
         """Return roots of expression as a dictionary
         Note this may not find them all."""
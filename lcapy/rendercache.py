@@ -0,0 +1,123 @@
+"""This module provides an on-disk cache of rendered schematics.  It
+is used when drawing a schematic to a PDF, PNG, or SVG file if
+`config.render_cache_dir` is not None.
+
+Each entry is a copy of the output file, keyed by a hash of the
+generated LaTeX document, the file type, the oversampling factor, and
+the circuitikz and Lcapy versions.  Thus pdflatex and the converters
+are only run when the schematic or the rendering options change.  The
+least recently used entries are removed when the total size of the
+cache exceeds `config.render_cache_size` bytes.
+
+Copyright 2019 Michael Hayes, UCECE
+
+"""
+
+from __future__ import division
+from . import config
+import hashlib
+import os
+import shutil
+
+
+def cache_key(content, ext, oversample, circuitikz_version=''):
+    """Return a hash for the LaTeX document content rendered to a file
+    of type ext."""
+
+    from . import __version__
+
+    text = '\n'.join((content, ext, repr(float(oversample)),
+                      str(circuitikz_version), __version__))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _filename(key, ext):
+
+    return os.path.join(config.render_cache_dir, key + ext)
+
+
+def cache_load(key, filename):
+    """Copy the cache entry `key` to filename.  Return True if
+    successful or False if there is no entry."""
+
+    if config.render_cache_dir is None:
+        return False
+
+    cachename = _filename(key, os.path.splitext(filename)[1])
+    try:
+        shutil.copyfile(cachename, filename)
+    except (IOError, OSError):
+        return False
+
+    try:
+        # Mark as most recently used.
+        os.utime(cachename, None)
+    except OSError:
+        pass
+    return True
+
+
+def cache_store(key, filename):
+    """Store a copy of the rendered file filename."""
+
+    if config.render_cache_dir is None:
+        return
+
+    try:
+        if not os.path.isdir(config.render_cache_dir):
+            os.makedirs(config.render_cache_dir)
+        cachename = _filename(key, os.path.splitext(filename)[1])
+        # Write to a temporary file so that a reader, say another
+        # process rendering the same schematic, never sees a partially
+        # written entry.
+        tmpname = '%s.%d.tmp' % (cachename, os.getpid())
+        shutil.copyfile(filename, tmpname)
+        os.replace(tmpname, cachename)
+    except (IOError, OSError):
+        return
+
+    cache_prune()
+
+
+def cache_prune(size=None):
+    """Remove the least recently used entries until the total size of
+    the cache does not exceed `size` bytes.  The default size is
+    `config.render_cache_size`."""
+
+    if config.render_cache_dir is None:
+        return
+    if size is None:
+        size = config.render_cache_size
+
+    entries = []
+    total = 0
+    try:
+        names = os.listdir(config.render_cache_dir)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith('.tmp'):
+            continue
+        filename = os.path.join(config.render_cache_dir, name)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, filename))
+        total += stat.st_size
+
+    entries.sort()
+    for mtime, nbytes, filename in entries:
+        if total <= size:
+            break
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+        total -= nbytes
+
+
+def cache_clear():
+    """Remove all the entries from the cache."""
+
+    cache_prune(0)
@@ -45,7 +45,9 @@ from .schemmisc import Pos, Opts
 from .netfile import NetfileMixin
 from .system import run_latex, convert_pdf_png, convert_pdf_svg
 from .system import tmpfilename, circuitikz_version, latex_cleanup
+from .rendercache import cache_key, cache_load, cache_store
 from os import path, remove
+import os
 from collections import OrderedDict
 import math
 
@@ -636,39 +638,7 @@ class Schematic(NetfileMixin):
                     '\\usepackage{circuitikz}\n'
                     '\\usetikzlibrary{fit, shapes}\n'
                     '\\begin{document}\n%s\\end{document}')
-        content = template % content
-
-        tex_filename = filename.replace(ext, '.tex')
-        open(tex_filename, 'w').write(content)
-
-        if ext == '.tex':
-            return
-
-        pdf_filename = tex_filename.replace('.tex', '.pdf')
-        run_latex(tex_filename)
-        if not debug:
-            latex_cleanup(tex_filename, pdf_filename)
-
-        if not path.exists(pdf_filename):
-            raise RuntimeError('Could not generate %s with pdflatex' % 
-                               pdf_filename)
-
-        if ext == '.pdf':
-            return
-
-        if ext == '.svg':
-            convert_pdf_svg(pdf_filename, root + '.svg')
-            if not debug:
-                remove(pdf_filename)
-            return
-
-        if ext == '.png':
-            convert_pdf_png(pdf_filename, root + '.png', oversample)
-            if not debug:
-                remove(pdf_filename)
-            return
-
-        raise RuntimeError('Cannot create file of type %s' % ext)
+        render(template % content, filename, oversample, debug)
 
     def draw(self, filename=None, opts={}, **kwargs):
         """
@@ -770,6 +740,133 @@ class Schematic(NetfileMixin):
         
         self.tikz_draw(filename=filename, **kwargs)
 
+
+
+def render(content, filename, oversample=2, debug=False):
+    """Render the LaTeX document content to filename, say a .tex,
+    .pdf, .png, or .svg file.  PDF, PNG, and SVG files are reused from
+    the render cache if `config.render_cache_dir` is not None."""
+
+    root, ext = path.splitext(filename)
+
+    tex_filename = filename.replace(ext, '.tex')
+    if ext == '.tex':
+        open(tex_filename, 'w').write(content)
+        return
+
+    if ext not in ('.pdf', '.svg', '.png'):
+        raise RuntimeError('Cannot create file of type %s' % ext)
+
+    key = cache_key(content, ext, oversample, circuitikz_version())
+    if not debug and cache_load(key, filename):
+        return
+
+    open(tex_filename, 'w').write(content)
+
+    pdf_filename = tex_filename.replace('.tex', '.pdf')
+    run_latex(tex_filename)
+    if not debug:
+        latex_cleanup(tex_filename, pdf_filename)
+
+    if not path.exists(pdf_filename):
+        raise RuntimeError('Could not generate %s with pdflatex' % 
+                           pdf_filename)
+
+    if ext == '.svg':
+        convert_pdf_svg(pdf_filename, root + '.svg')
+        if not debug:
+            remove(pdf_filename)
+
+    elif ext == '.png':
+        convert_pdf_png(pdf_filename, root + '.png', oversample)
+        if not debug:
+            remove(pdf_filename)
+
+    cache_store(key, filename)
+
+
+def _init_worker(cache_dir, cache_size, version):
+    """Initialise a process drawing schematics for draw_batch.  The
+    configuration is not inherited when processes are spawned rather
+    than forked, so the render cache settings and the circuitikz
+    version found by the parent are set explicitly."""
+
+    from . import config, system
+
+    config.render_cache_dir = cache_dir
+    config.render_cache_size = cache_size
+    system._circuitikz_version = version
+
+
+def _draw_file(infilename, outfilename, model, kwargs):
+
+    from .circuit import Circuit
+
+    cct = Circuit(infilename)
+    if model is not None:
+        cct = getattr(cct, model)()
+    cct.draw(filename=outfilename, **kwargs)
+
+
+def draw_batch(filenames, ext='.png', model=None, processes=None, **kwargs):
+    """Draw the schematic for each of the netlist files in the list
+    filenames to a file of type ext, say '.png', with the same root
+    name.  Alternatively, filenames can be a list of (netlist-file,
+    output-file) tuples.  The schematics are drawn by `processes`
+    processes, or by `config.render_processes` processes if this is
+    None, and the rendered files are reused from the render cache if
+    `config.render_cache_dir` is not None.
+
+    model is None or the name of a Circuit method, such as 's_model',
+    to apply to each netlist.  kwargs are passed to the draw method.
+
+    A RuntimeError listing the netlist files that could not be drawn
+    is raised after all the schematics have been drawn."""
+
+    from . import config
+
+    jobs = []
+    for filename in filenames:
+        if isinstance(filename, tuple):
+            jobs.append(filename)
+        else:
+            jobs.append((filename, path.splitext(filename)[0] + ext))
+
+    if processes is None:
+        processes = config.render_processes or os.cpu_count() or 1
+    processes = min(processes, len(jobs))
+
+    errors = []
+    if processes <= 1:
+        for infilename, outfilename in jobs:
+            try:
+                _draw_file(infilename, outfilename, model, kwargs)
+            except Exception as e:
+                errors.append('%s: %s' % (infilename, e))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Find the circuitikz version before starting the processes
+        # so that they do not all run pdflatex to find it.
+        initargs = (config.render_cache_dir, config.render_cache_size,
+                    circuitikz_version())
+
+        with ProcessPoolExecutor(processes, initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            futures = [executor.submit(_draw_file, infilename, outfilename,
+                                       model, kwargs)
+                       for infilename, outfilename in jobs]
+            for (infilename, outfilename), future in zip(jobs, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append('%s: %s' % (infilename, e))
+
+    if errors != []:
+        raise RuntimeError('Could not draw schematics:\n' +
+                           '\n'.join(errors))
+
+
 def test():
 
     sch = Schematic()
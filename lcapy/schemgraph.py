@@ -354,9 +354,17 @@ class Graph(dict):
         return pos, distance_max
 
     def longest_path_to_known(self, start, forward=True):
-        """Find longest path through DAG to a node with a known dist."""
+        """Find longest path through DAG to a node with a known dist.
+        The distance to the known node is memoized for each node so
+        each edge is only traversed once."""
 
-        def traverse(gnode):
+        def edges(gnode):
+
+            if gnode.name in ('start', 'end') or gnode.pos is not None:
+                return iter(())
+            return iter(gnode.fedges if forward else gnode.redges)
+
+        def dist(gnode):
 
             if gnode.name in ('start', 'end'):
                 # Choose as last resort
@@ -367,59 +375,111 @@ class Graph(dict):
                 gnode.next = None
                 return gnode.pos
 
-            edges = gnode.fedges if forward else gnode.redges
             min_dist = 2000
-            for edge in edges:
+            for edge in (gnode.fedges if forward else gnode.redges):
                 next_gnode = edge.to_gnode
-                # TODO, memoize
-                dist = traverse(next_gnode) - edge.size
+                dist = dists[next_gnode.name] - edge.size
                 if dist < min_dist:
                     min_dist = dist
                     next_gnode.prev = edge
                     gnode.next = edge
             return min_dist
 
+        # Depth-first traversal using an explicit stack; the distance
+        # of a node is found once the distances of all its successors
+        # are known.
+        dists = {}
+        active = set((start.name, ))
+        stack = [(start, edges(start))]
         start.dist = 0
-        try:
-            return traverse(start)
-        except RuntimeError:
-            raise RuntimeError(
-                ("The %s schematic graph is dodgy, probably a component"
-                 " is connected to the wrong node:\n%s") % (self.name, self))
+        while stack:
+            gnode, remaining = stack[-1]
+            for edge in remaining:
+                next_gnode = edge.to_gnode
+                if next_gnode.name in dists:
+                    continue
+                if next_gnode.name in active:
+                    raise RuntimeError(
+                        ("The %s schematic graph is dodgy, probably a "
+                         "component is connected to the wrong node:\n%s")
+                        % (self.name, self))
+                active.add(next_gnode.name)
+                stack.append((next_gnode, edges(next_gnode)))
+                break
+            else:
+                stack.pop()
+                active.discard(gnode.name)
+                dists[gnode.name] = dist(gnode)
+
+        return dists[start.name]
 
     def longest_path(self, start, forward=True):
-        """Find longest path through DAG."""
+        """Find longest path through DAG.  The distances are found by
+        visiting the nodes in topological order.  The path to each node
+        is the first found by a depth-first traversal of the edges on a
+        longest path, so that the same path is chosen for the same
+        graph."""
 
         for gnode in self.values():
             gnode.dist = -1
             gnode.prev = None
             gnode.next = None
 
-        def traverse(gnode):
+        def edges(gnode):
 
-            if gnode.pos is not None:
-                return True
+            return gnode.fedges if forward else gnode.redges
 
-            edges = gnode.fedges if forward else gnode.redges
-            for edge in edges:
-                next_gnode = edge.to_gnode
-                dist = gnode.dist + edge.size
-                if dist > next_gnode.dist:
-                    next_gnode.dist = dist
-                    next_gnode.prev = edge
-                    gnode.next = edge
-                    if traverse(next_gnode):
-                        return True
-            return False
+        # Find the nodes reachable from the start node and the number
+        # of edges into each of them.
+        indegree = {start.name: 0}
+        stack = [start]
+        while stack:
+            gnode = stack.pop()
+            for edge in edges(gnode):
+                name = edge.to_gnode.name
+                if name not in indegree:
+                    indegree[name] = 0
+                    stack.append(edge.to_gnode)
+                indegree[name] += 1
 
+        # Relax the edges out of each node in topological order.
         start.dist = 0
-        try:
-            traverse(start)
-        except RuntimeError:
+        stack = [start]
+        count = 0
+        while stack:
+            gnode = stack.pop()
+            count += 1
+            for edge in edges(gnode):
+                next_gnode = edge.to_gnode
+                next_gnode.dist = max(next_gnode.dist,
+                                      gnode.dist + edge.size)
+                indegree[next_gnode.name] -= 1
+                if indegree[next_gnode.name] == 0:
+                    stack.append(next_gnode)
+
+        if count != len(indegree):
+            # There is a cycle.
             raise RuntimeError(
                 ("The %s schematic graph is dodgy, probably a component"
                  " is connected to the wrong node:\n%s") % (self.name, self))
 
+        # Choose the path to each node by a depth-first traversal of
+        # the edges on a longest path.
+        visited = set((start.name, ))
+        stack = [iter(edges(start))]
+        while stack:
+            for edge in stack[-1]:
+                next_gnode = edge.to_gnode
+                if (next_gnode.name in visited or
+                    edge.from_gnode.dist + edge.size != next_gnode.dist):
+                    continue
+                visited.add(next_gnode.name)
+                next_gnode.prev = edge
+                edge.from_gnode.next = edge
+                stack.append(iter(edges(next_gnode)))
+                break
+            else:
+                stack.pop()
 
     def check_positions(self):
 
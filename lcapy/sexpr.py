@@ -4,6 +4,7 @@ from .sfwexpr import sfwExpr
 from .sym import ssym, tsym, j, pi
 from .vector import Vector
 from .ratfun import _zp2tf, Ratfun
+from math import factorial
 import sympy as sym
 import numpy as np
 
@@ -11,6 +12,8 @@ import numpy as np
 class sExpr(sfwExpr):
     """s-domain expression or symbol."""
 
+    __slots__ = ()
+
     var = ssym
 
     def __init__(self, val, **assumptions):
@@ -18,7 +21,7 @@ class sExpr(sfwExpr):
         super(sExpr, self).__init__(val, **assumptions)
         self._laplace_conjugate_class = tExpr
 
-        if self.expr.find(tsym) != set():
+        if tsym in self.expr.free_symbols:
             raise ValueError(
                 's-domain expression %s cannot depend on t' % self.expr)
 
@@ -99,24 +102,77 @@ class sExpr(sfwExpr):
 
         return self.time(**assumptions).phasor(**assumptions)
 
-    def transient_response(self, tvector=None):
-        """Evaluate transient (impulse) response."""
+    def transient_response(self, tvector=None, method='symbolic'):
+        """Evaluate transient (impulse) response.
+
+        If method is 'residue', the response is evaluated numerically
+        from the poles and residues found with NumPy and SciPy.  This
+        is much faster for high order rational functions with numeric
+        coefficients."""
 
         if tvector is None:
             return self.time()
 
+        if method == 'residue':
+            return self._transient_response_residue(tvector)
+        elif method != 'symbolic':
+            raise ValueError('Unknown method %s' % method)
+
         return self.time().evaluate(tvector)
 
-    def impulse_response(self, tvector=None):
+    def _transient_response_residue(self, tvector):
+
+        r, p, m, k, delay = Ratfun(self.expr, self.var).as_residue_parts_numeric()
+
+        t0 = np.asarray(tvector, dtype=float)
+        scalar = t0.ndim == 0
+        t0 = np.atleast_1d(t0)
+        t = t0 - delay
+
+        # As for inverse_laplace, the response for t < 0 is zero if
+        # causal, extrapolated if dc or ac, and otherwise unknown.
+        # A delayed response is only zero before the delay if causal;
+        # otherwise it is extrapolated back to t = 0.
+        assumptions = self.assumptions
+        causal = assumptions.get('causal', False)
+        extrapolate = (assumptions.get('dc', False) or
+                       assumptions.get('ac', False))
+        if extrapolate or not causal:
+            tp = t
+        else:
+            tp = np.where(t >= 0, t, 0)
+
+        h = np.zeros(t.shape, dtype=complex)
+        for ri, pi, mi in zip(r, p, m):
+            h += ri * tp ** (mi - 1) / factorial(mi - 1) * np.exp(pi * tp)
+
+        if len(k) > 1:
+            raise ValueError('Cannot numerically evaluate derivatives of'
+                             ' DiracDelta for %s' % self)
+        if len(k) == 1 and k[0] != 0:
+            h += np.where(t == 0, np.inf, 0)
+
+        if causal:
+            h[t < 0] = 0
+        elif not extrapolate:
+            h[t0 < 0] = np.nan
+
+        if np.allclose(h[np.isfinite(h)].imag, 0.0):
+            h = h.real
+        if scalar:
+            return h[0]
+        return h
+
+    def impulse_response(self, tvector=None, method='symbolic'):
         """Evaluate transient (impulse) response."""
 
-        return self.transient_response(tvector)
+        return self.transient_response(tvector, method)
 
-    def step_response(self, tvector=None):
+    def step_response(self, tvector=None, method='symbolic'):
         """Evaluate step response."""
 
         H = self.__class__(self / self.var, **self.assumptions)
-        return H.transient_response(tvector)
+        return H.transient_response(tvector, method)
 
     def angular_frequency_response(self, wvector=None):
         """Convert to angular frequency domain and evaluate response if
@@ -146,54 +202,103 @@ class sExpr(sfwExpr):
 
         return X.evaluate(fvector)
 
-    def response(self, x, t):
-        """Evaluate response to input signal x at times t."""
+    def response(self, x, t, method='lfilter'):
+        """Evaluate response to input signal x at times t.
+
+        The method can be:
+        'lfilter' -- the rational function is discretized assuming
+        a zero-order hold and the input is filtered in chunks with
+        scipy.signal.lfilter (see `stream_filter`),
+        'fft' -- the input, held constant between samples, is
+        convolved with the response to a pulse of one sample duration
+        using an FFT,
+        'convolve' -- the input is directly convolved with the impulse
+        response.
+
+        The 'lfilter' and 'fft' methods require the coefficients of
+        the rational function to be numeric."""
 
         if len(x) != len(t):
             raise ValueError('x must have same length as t')
 
+        x = np.asarray(x)
+        t = np.asarray(t)
+
         dt = t[1] - t[0]
         if not np.allclose(np.diff(t), np.ones(len(t) - 1) * dt):
-            raise (ValueError, 't values not equally spaced')
+            raise ValueError('t values not equally spaced')
+
+        if method == 'lfilter':
+            return self.stream_filter(dt).filter(x)
 
         # Perform polynomial long division so expr = Q + M / D                
         N, D, delay = self.decompose()
-        Q, M = sym.div(N, D)
+        Q, M = sym.div(N, D, self.var)
         expr = M / D
 
         N = len(t)
 
-        # Evaluate transient response.
-        th = np.arange(N) * dt - dt
-        h = sExpr(expr).transient_response(th)
-
-        print('Convolving...')
-        ty = t
-        y = np.convolve(x, h)[0:N] * dt
+        if method == 'fft':
+            from scipy.signal import fftconvolve
+
+            # The response to a pulse of one sample duration is the
+            # difference of the step response at successive samples.
+            # Convolving with this matches the zero-order hold
+            # assumed by the 'lfilter' method.
+            th = np.arange(N + 1) * dt - dt
+            g = sExpr(expr / self.var, causal=True).transient_response(
+                th, method='residue')
+            y = fftconvolve(x, np.diff(g))[0:N]
+        elif method == 'convolve':
+            # Evaluate transient response.
+            th = np.arange(N) * dt - dt
+            h = sExpr(expr, causal=True).transient_response(th)
+
+            y = np.convolve(x, h)[0:N] * dt
+        else:
+            raise ValueError('Unknown method %s' % method)
 
         if Q:
-            # Handle Dirac deltas and their derivatives.
-            C = Q.all_coeffs()
-            for n, c in enumerate(C):
+            # Handle Dirac deltas and their derivatives.  These are
+            # approximated as for the 'lfilter' method.
+            from .streamfilter import _polynomial_response
 
-                y += c * x
-
-                x = np.diff(x) / dt
-                x = np.hstack((x, 0))
-
-        from scipy.interpolate import interp1d
+            C = sym.Poly(Q, self.var).all_coeffs()
+            q = [float(c) for c in reversed(C)]
+            y += _polynomial_response(q, x, np.zeros(len(q) - 1), dt)
 
         if delay != 0.0:
-            print('Interpolating...')
-            # Try linear interpolation; should oversample first...
-            y = interp1d(ty, y, bounds_error=False, fill_value=0)
-            y = y(t - delay)
+            delay = float(delay)
+            m = int(round(delay / dt))
+            if np.isclose(m * dt, delay):
+                # Delay by a whole number of samples.
+                y = np.hstack((np.zeros(min(m, N)), y[0:max(N - m, 0)]))
+            else:
+                from scipy.interpolate import interp1d
+
+                # Try linear interpolation; should oversample first...
+                y = interp1d(t, y, bounds_error=False, fill_value=0)
+                y = y(t - delay)
 
         return y
 
+    def stream_filter(self, dt):
+        """Return a stateful filter with sampling interval dt for
+        finding the response to a signal presented in blocks, say
+        read from a numpy.memmap.  For example:
+
+        filt = H.stream_filter(dt)
+        for y in filt.blocks(x_blocks):
+            ...
+
+        The coefficients of the rational function must be numeric."""
+
+        from .streamfilter import StreamFilter
+        return StreamFilter(self, dt)
+
     def decompose(self):
 
-        N, D, delay = Ratfun(self, s).as_ratfun_delay()                
+        N, D, delay = Ratfun(self.expr, self.var).as_ratfun_delay()
 
         return N, D, delay
 
@@ -214,6 +319,8 @@ class Zs(sExpr):
 
     """s-domain impedance value."""
 
+    __slots__ = ()
+
     quantity = 'Impedance'
     units = 'ohms'
 
@@ -265,6 +372,8 @@ class Ys(sExpr):
 
     """s-domain admittance value."""
 
+    __slots__ = ()
+
     quantity = 'Admittance'
     units = 'siemens'
 
@@ -316,6 +425,8 @@ class Vs(sExpr):
 
     """s-domain voltage (units V s / radian)."""
 
+    __slots__ = ()
+
     quantity = 's-Voltage'
     units = 'V/Hz'
 
@@ -333,6 +444,8 @@ class Is(sExpr):
 
     """s-domain current (units A s / radian)."""
 
+    __slots__ = ()
+
     quantity = 's-Current'
     units = 'A/Hz'
 
@@ -351,6 +464,8 @@ class Hs(sExpr):
 
     """s-domain ratio"""
 
+    __slots__ = ()
+
     quantity = 's-ratio'
     units = ''
 
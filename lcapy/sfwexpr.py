@@ -2,6 +2,8 @@ from .expr import Expr, Exprdict
 
 class sfwExpr(Expr):
 
+    __slots__ = ()
+
     def __init__(self, val, **assumptions):
 
         super(sfwExpr, self).__init__(val, **assumptions)
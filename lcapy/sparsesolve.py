@@ -0,0 +1,237 @@
+"""This module provides a sparse, fraction-free linear equation solver.
+It is used by the MNA class as an alternative to the inversion of
+the A matrix.
+
+The equations A x = b are converted into polynomials with integer or
+rational coefficients (over a ring with generators determined by
+SymPy) and solved using Bareiss elimination.  The pivots are chosen
+using the Markowitz criterion to limit fill-in.  Only the solution
+for the specified right-hand side(s) is found; the inverse of A is
+never formed.  The back substitution can be performed for selected
+unknowns, so that only the unknowns that are required are found.
+
+Copyright 2019 Michael Hayes, UCECE
+
+"""
+
+from __future__ import division
+from sympy.polys.fields import sfield
+import sympy as sym
+
+
+def _choose_pivot(rows, col_rows):
+    """Find pivot with the smallest Markowitz count (r - 1) * (c - 1).
+    Ties are broken by choosing the pivot with the fewest terms."""
+
+    best = None
+    best_cost = None
+    for i, row in rows.items():
+        r = len(row) - 1
+        for j, value in row.items():
+            if j not in col_rows:
+                # Right-hand side column
+                continue
+            cost = (r * (len(col_rows[j]) - 1), len(value))
+            if best_cost is None or cost < best_cost:
+                best, best_cost = (i, j), cost
+                if cost == (0, 1):
+                    return best
+    return best
+
+
+class FractionFreeSolver(object):
+    """Solver for A x = b using sparse fraction-free Bareiss
+    elimination.  A is a square SymPy matrix and b is a SymPy matrix
+    with one or more columns.
+
+    The elimination is performed when the solver is created.  The
+    back substitution is only performed for the unknowns that are
+    requested (and those that they depend on) with the `unknown`
+    method.
+
+    A ValueError exception is raised if A is singular.
+
+    """
+
+    def __init__(self, A, b):
+
+        N = A.rows
+        if A.cols != N:
+            raise ValueError('Matrix is not square')
+        if b.rows != N:
+            raise ValueError('Incompatible right-hand side')
+        M = b.cols
+
+        self.N = N
+        self.M = M
+        self._y = {}
+
+        if N == 0:
+            self._pivots = []
+            return
+
+        # Collect the non-zero entries; the right-hand side columns are
+        # stored after the columns of A.
+        keys = []
+        exprs = []
+        for i in range(N):
+            for j in range(N):
+                if A[i, j] != 0:
+                    keys.append((i, j))
+                    exprs.append(A[i, j])
+            for m in range(M):
+                if b[i, m] != 0:
+                    keys.append((i, N + m))
+                    exprs.append(b[i, m])
+
+        if exprs == []:
+            raise ValueError('Matrix is singular')
+
+        field, elts = sfield(exprs)
+        ring = field.ring
+        self._field = field
+        self._ring = ring
+
+        frows = dict((i, {}) for i in range(N))
+        for (i, j), elt in zip(keys, elts):
+            if elt:
+                frows[i][j] = elt
+
+        # Clear the denominators of each row so that the elimination can
+        # be performed with polynomials.  Scaling a row (including its
+        # right-hand side) does not change the solution.
+        rows = {}
+        for i, frow in frows.items():
+            den = ring.one
+            for elt in frow.values():
+                den = den.lcm(elt.denom)
+            rows[i] = dict((j, elt.numer * den.exquo(elt.denom))
+                           for j, elt in frow.items())
+
+        # Rows containing a non-zero entry for each unknown column.
+        col_rows = dict((j, set()) for j in range(N))
+        for i, row in rows.items():
+            for j in row:
+                if j < N:
+                    col_rows[j].add(i)
+
+        pivots = []
+        prev = ring.one
+        for k in range(N):
+            pivot = _choose_pivot(rows, col_rows)
+            if pivot is None:
+                raise ValueError('Matrix is singular')
+
+            pi, pj = pivot
+            prow = rows.pop(pi)
+            p = prow[pj]
+            pivots.append((pj, prow))
+
+            for j in prow:
+                if j < N:
+                    col_rows[j].discard(pi)
+            eliminated = col_rows.pop(pj)
+            for i in eliminated:
+                # Only rows with a non-zero entry in the pivot column
+                # require elimination.
+                row = rows[i]
+                a = row.pop(pj)
+                for j in set(row).union(prow):
+                    if j == pj:
+                        continue
+                    value = (row.get(j, ring.zero) * p -
+                             a * prow.get(j, ring.zero))
+                    value = value.exquo(prev)
+                    if value:
+                        if j not in row and j < N:
+                            col_rows[j].add(i)
+                        row[j] = value
+                    elif j in row:
+                        del row[j]
+                        if j < N:
+                            col_rows[j].discard(i)
+
+            # The other rows are scaled by p / prev to keep the
+            # divisions exact at the next step.
+            if prev != p:
+                for i, row in rows.items():
+                    if i in eliminated:
+                        continue
+                    for j in row:
+                        row[j] = (row[j] * p).exquo(prev)
+            prev = p
+
+        # The last pivot is the determinant (to within a sign) of A.
+        # Check that it is not zero when the generators, say I or
+        # sqrt(x), are replaced by their SymPy values.
+        det = prev
+        if sym.expand(det.as_expr()) == 0:
+            raise ValueError('Matrix is singular')
+
+        self._pivots = pivots
+        self._det = det
+        self._fdet = field(det)
+
+    def _substitute(self, j):
+        """Find y[j] = det * x[j], a polynomial by Cramer's rule, and
+        those y values it depends on, by fraction-free back
+        substitution."""
+
+        N = self.N
+        order = dict((pj, k) for k, (pj, prow) in enumerate(self._pivots))
+
+        # Find the unknowns that are required, in the reverse of the
+        # order that they were eliminated.
+        required = set()
+        stack = [j]
+        while stack:
+            pj = stack.pop()
+            if pj in required or pj in self._y:
+                continue
+            required.add(pj)
+            prow = self._pivots[order[pj]][1]
+            stack.extend(j1 for j1 in prow if j1 < N and j1 != pj)
+
+        for pj in sorted(required, key=order.get, reverse=True):
+            prow = self._pivots[order[pj]][1]
+            u = prow[pj]
+            values = []
+            for m in range(self.M):
+                value = prow.get(N + m, self._ring.zero) * self._det
+                for j1, coeff in prow.items():
+                    if j1 < N and j1 != pj:
+                        value -= coeff * self._y[j1][m]
+                values.append(value.exquo(u))
+            self._y[pj] = values
+
+    def unknown(self, j):
+        """Return list of the SymPy expressions for unknown j for
+        each column of b."""
+
+        if j not in self._y:
+            self._substitute(j)
+        return [(self._field(y) / self._fdet).as_expr() if y else sym.S.Zero
+                for y in self._y[j]]
+
+    def solution(self):
+        """Return SymPy matrix of the solution x with the same shape
+        as b."""
+
+        x = sym.zeros(self.N, self.M)
+        for j in range(self.N):
+            for m, value in enumerate(self.unknown(j)):
+                x[j, m] = value
+        return x
+
+
+def fraction_free_solve(A, b):
+    """Solve A x = b for x using sparse fraction-free Bareiss
+    elimination.  A is a square SymPy matrix and b is a SymPy matrix
+    with one or more columns.  A SymPy matrix of the same shape as b
+    is returned.
+
+    A ValueError exception is raised if A is singular.
+
+    """
+
+    return FractionFreeSolver(A, b).solution()
@@ -0,0 +1,146 @@
+"""This module provides a stateful filter for finding the response of
+a system, described by a rational s-domain transfer function
+(possibly with a delay), to a long signal presented in blocks.
+
+The strictly proper part of the transfer function is discretized
+assuming a zero-order hold on the input.  The polynomial part is
+approximated by backward differences and the delay by linear
+interpolation between samples.
+
+Copyright 2019 Michael Hayes, UCECE
+
+"""
+
+from __future__ import division
+from . import config
+import numpy as np
+import sympy as sym
+
+
+def _zoh(N, D, var, dt):
+    """Return coefficients (b, a) of the discrete-time filter for the
+    rational function N / D found assuming a zero-order hold on the
+    input with sampling interval dt."""
+
+    from scipy.signal import cont2discrete
+
+    try:
+        b = [float(c) for c in sym.Poly(N, var).all_coeffs()]
+        a = [float(c) for c in sym.Poly(D, var).all_coeffs()]
+    except TypeError:
+        raise ValueError('Cannot discretize %s since it has symbols other'
+                         ' than %s' % (N / D, var))
+
+    bd, ad, _ = cont2discrete((b, a), dt, method='zoh')
+    return np.ravel(bd), ad
+
+
+def _polynomial_response(q, x, xprev, dt):
+    """Return the response to the samples x of the polynomial part of
+    a transfer function with coefficients q, in increasing powers of s.
+    The derivatives are approximated by backward differences.  xprev
+    holds the previous input sample for each derivative order and is
+    updated in place."""
+
+    y = np.zeros(len(x))
+    for n, c in enumerate(q):
+        if n > 0:
+            prev = xprev[n - 1]
+            xprev[n - 1] = x[-1] if len(x) else prev
+            x = np.diff(np.hstack((prev, x))) / dt
+        if c != 0:
+            y += c * x
+    return y
+
+
+class StreamFilter(object):
+    """Filter for transfer function H with sampling interval dt.  The
+    state of the filter is kept between calls so that a signal can
+    be filtered a block at a time.  For example:
+
+    filt = StreamFilter(H, dt)
+    for y in filt.blocks(x_blocks):
+        ...
+
+    """
+
+    def __init__(self, H, dt):
+
+        N, D, delay = H.decompose()
+        var = H.var
+        Q, M = sym.div(N, D, var)
+
+        self.dt = dt
+        self.b, self.a = _zoh(M, D, var, dt)
+
+        try:
+            self.q = [float(c) for c in
+                      reversed(sym.Poly(Q, var).all_coeffs())]
+            delay = float(delay)
+        except TypeError:
+            raise ValueError('Cannot discretize %s since it has symbols'
+                             ' other than %s' % (H, var))
+        if delay < 0:
+            raise ValueError('Cannot filter with negative delay for %s' % H)
+
+        # Split delay into a whole number of samples and a fraction.
+        m = int(round(delay / dt))
+        if np.isclose(m * dt, delay):
+            self.delay_samples, self.delay_fraction = m, 0.0
+        else:
+            m = int(np.floor(delay / dt))
+            self.delay_samples, self.delay_fraction = m, delay / dt - m
+        self.reset()
+
+    def reset(self):
+        """Reset the state of the filter to zero."""
+
+        self._zi = np.zeros(max(len(self.a), len(self.b)) - 1)
+        # Previous input sample for each derivative order.
+        self._xprev = np.zeros(max(len(self.q) - 1, 0))
+        # Delay line.
+        self._ybuffer = np.zeros(self.delay_samples +
+                                 (self.delay_fraction != 0))
+
+    def __call__(self, x):
+        """Filter the block of samples x and return the output block."""
+
+        from scipy.signal import lfilter
+
+        x = np.asarray(x, dtype=float)
+        y, self._zi = lfilter(self.b, self.a, x, zi=self._zi)
+
+        # Handle Dirac deltas and their derivatives.
+        y += _polynomial_response(self.q, x, self._xprev, self.dt)
+
+        if len(self._ybuffer) == 0:
+            return y
+
+        y = np.hstack((self._ybuffer, y))
+        self._ybuffer = y[len(y) - len(self._ybuffer):]
+        m = self.delay_samples
+        f = self.delay_fraction
+        if f == 0:
+            return y[0:len(y) - m]
+        return (1 - f) * y[1:len(y) - m] + f * y[0:len(y) - m - 1]
+
+    def blocks(self, blocks):
+        """Generator that filters each block of samples from the
+        iterable blocks in turn."""
+
+        for x in blocks:
+            yield self(x)
+
+    def filter(self, x, out=None, chunk_size=None):
+        """Filter the array x, say a numpy.memmap, processing chunk_size
+        samples at a time.  The output is stored in out if specified,
+        say another numpy.memmap.  The default chunk_size is
+        config.response_chunk_size."""
+
+        if chunk_size is None:
+            chunk_size = config.response_chunk_size
+        if out is None:
+            out = np.empty(len(x))
+        for m in range(0, len(x), chunk_size):
+            out[m:m + chunk_size] = self(x[m:m + chunk_size])
+        return out
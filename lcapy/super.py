@@ -86,7 +86,7 @@ class Super(Exprdict):
 
         keys = []
         for key in self.decompose().keys():
-            if not isinstance(key, str) or key is 'w':
+            if not isinstance(key, str) or key == 'w':
                 keys.append(key)
         return keys
 
@@ -95,7 +95,7 @@ class Super(Exprdict):
 
         keys = []
         for key in self.keys():
-            if isinstance(key, str) and key[0] is 'n':
+            if isinstance(key, str) and key[0] == 'n':
                 keys.append(key)
         return keys    
 
@@ -354,14 +354,14 @@ class Super(Exprdict):
               include the DC and AC components).
 
         """
-        if kind is 'super':
+        if kind == 'super':
             return self
-        elif kind is 'time':
+        elif kind == 'time':
             return self.time()
-        elif kind is 'ivp':
+        elif kind == 'ivp':
             return self.laplace()
 
-        if isinstance(kind, str) and kind[0] is 'n':
+        if isinstance(kind, str) and kind[0] == 'n':
             if kind not in self:
                 return self.decompose_domains['n'](0)
             return self[kind]
@@ -381,9 +381,9 @@ class Super(Exprdict):
     def netval(self, kind):
 
         def kind_keyword(kind):
-            if isinstance(kind, str) and kind[0] is 'n':
+            if isinstance(kind, str) and kind[0] == 'n':
                 return 'noise'
-            elif kind is 'ivp':
+            elif kind == 'ivp':
                 return 's'
             elif kind in ('t', 'time'):
                 return ''                
@@ -402,7 +402,7 @@ class Super(Exprdict):
         if 'nid' in val.assumptions:
             return '%s {%s} %s' % (keyword, val, val.nid)
 
-        if keyword is 'ac':
+        if keyword == 'ac':
             return '%s {%s} {%s} {%s}' % (keyword, val, 0, val.omega)
 
         return '%s {%s}' % (keyword, val)
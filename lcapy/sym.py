@@ -10,6 +10,7 @@ from sympy.core.function import AppliedUndef
 import sympy as sym
 import re
 from .context import context
+from .transformcache import TransformCache
 
 __all__ = ('symsymbol', 'sympify', 'simplify')
 
@@ -23,6 +24,10 @@ for _symbol in exclude:
 for _alias, _name in aliases.items():
     global_dict[_alias] = global_dict[_name]
 
+# The results depend on the symbols of the context in which the
+# strings are parsed so they are not saved with the transform caches.
+parse_cache = TransformCache('parse', persist=False)
+
 
 cpt_names = ('C', 'E', 'F', 'G', 'H', 'I', 'L', 'R', 'V', 'Y', 'Z')
 cpt_name_pattern = re.compile(r"(%s)([\w']*)" % '|'.join(cpt_names))
@@ -65,8 +70,20 @@ def canonical_name(name):
     return name
 
 
-def symbols_find(arg):
-    """Return list of symbols in arg.  No symbols are cached."""
+symbols_cache = TransformCache('symbols', persist=False)
+
+# Plain numbers, say component values, are converted without parsing.
+number_pattern = re.compile(r'((0|[1-9]\d*)(\.\d*)?|\.\d+)([eE][-+]?\d+)?$')
+
+
+def _symbols_find_string(arg):
+
+    if number_pattern.match(arg):
+        return ()
+
+    result = symbols_cache.get(arg)
+    if result is not None:
+        return result
 
     symbols = []
 
@@ -80,11 +97,18 @@ def symbols_find(arg):
                     symbols.append(name)
         return ([(NUMBER, '0')])
 
+    parse_expr(arg, transformations=(find_symbol, ), 
+               global_dict=global_dict, local_dict={}, evaluate=False)
+    result = tuple(symbols)
+    symbols_cache[arg] = result
+    return result
+
+
+def symbols_find(arg):
+    """Return list of symbols in arg.  No symbols are cached."""
+
     if isinstance(arg, str):
-        parse_expr(arg, transformations=(find_symbol, ), 
-                   global_dict=global_dict, local_dict={}, evaluate=False)
-        
-        return symbols
+        return list(_symbols_find_string(arg))
 
     # Hack
     if hasattr(arg, 'expr'):
@@ -95,11 +119,64 @@ def symbols_find(arg):
     return [repr(symbol) for symbol in arg.atoms(Symbol, AppliedUndef)]
 
 
+_missing = object()
+
+
+class _Identity(object):
+    """Wrapper comparing an unhashable object, such as a context's
+    dictionary of symbols, by identity.  A reference is kept so that
+    its id is not reused while it is part of a cache key."""
+
+    __slots__ = ('obj', )
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and self.obj is other.obj
+
+
 def parse(string, symbols={}, evaluate=True, local_dict={}, **assumptions):
-    """Handle arbitrary strings that may refer to multiple symbols."""
+    """Handle arbitrary strings that may refer to multiple symbols.
+
+    The results are cached, so identical strings, say component
+    values, share the same SymPy expression.  A cached result is
+    discarded if any of the names in the string have since been
+    redefined in symbols or local_dict.  Plain numbers are converted
+    to SymPy rationals without parsing."""
 
     cache = assumptions.pop('cache', True)
 
+    if number_pattern.match(string):
+        if string.isdigit():
+            return sym.Integer(int(string))
+        return sym.Rational(string)
+
+    try:
+        key = (string, _Identity(symbols), _Identity(local_dict),
+               evaluate, cache,
+               tuple(sorted(assumptions.items())))
+    except TypeError:
+        # Unhashable assumption.
+        key = None
+
+    def valid(result):
+        for name, local_value, symbol in result[1]:
+            if (local_dict.get(name, _missing) is not local_value or
+                symbols.get(name, _missing) is not symbol):
+                return False
+        return True
+
+    if key is not None:
+        result = parse_cache.get(key, valid)
+        if result is not None:
+            return result[0]
+
+    names = []
+
     def auto_symbol(tokens, local_dict, global_dict):
         """Inserts calls to ``Symbol`` or ``Function`` for undefined variables/functions."""
         result = []
@@ -110,6 +187,7 @@ def parse(string, symbols={}, evaluate=True, local_dict={}, **assumptions):
             nextTokNum, nextTokVal = nextTok
             if tokNum == NAME:
                 name = tokVal
+                names.append(name)
                 if name in global_dict:
 
                     obj = global_dict[name]
@@ -122,6 +200,7 @@ def parse(string, symbols={}, evaluate=True, local_dict={}, **assumptions):
                         continue
 
                 name = canonical_name(str(name))
+                names.append(name)
 
                 if name in local_dict:
                     # print('Found %s' % name)
@@ -154,15 +233,17 @@ def parse(string, symbols={}, evaluate=True, local_dict={}, **assumptions):
                                             rationalize), 
                    global_dict=global_dict, local_dict=local_dict,
                    evaluate=evaluate)
-    if not cache:
-        return s
-
-    # Look for newly defined symbols/functions.
-    for symbol in s.atoms(Symbol, AppliedUndef):
-        name = repr(symbol)
-        if name not in symbols:
-            symbols[name] = symbol
-
+    if cache:
+        # Look for newly defined symbols/functions.
+        for symbol in s.atoms(Symbol, AppliedUndef):
+            name = repr(symbol)
+            if name not in symbols:
+                symbols[name] = symbol
+
+    if key is not None:
+        depends = tuple((name, local_dict.get(name, _missing),
+                         symbols.get(name, _missing)) for name in set(names))
+        parse_cache[key] = (s, depends)
     return s
 
 
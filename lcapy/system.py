@@ -98,7 +98,22 @@ def run_dot(dotfilename, filename):
     return
 
 
+_circuitikz_version = None
+
+
 def circuitikz_version():
+    """Return the date of the installed circuitikz package or None if
+    it is not installed.  This is found once since running pdflatex
+    is slow."""
+
+    global _circuitikz_version
+
+    if _circuitikz_version is None:
+        _circuitikz_version = _find_circuitikz_version()
+    return _circuitikz_version
+
+
+def _find_circuitikz_version():
 
     content = r"""
     \documentclass[a4paper]{standalone}
@@ -390,3 +390,412 @@ class LcapyTester(unittest.TestCase):
         self.assertEqual(a.V1.v, Vt('5*cos(t)'), "V1 voltage incorrect")
         self.assertEqual(a.R1.i, It('(4*sin(t)+3*cos(t))/5'), "R1 current incorrect")
         
+
+    def test_fraction_free_solver(self):
+        """Lcapy: check fraction-free MNA solver
+
+        """
+
+        a = Circuit(solver='fraction-free')
+        a.add('V1 1 0 {V1 / s}')
+        a.add('R1 1 2')
+        a.add('L1 2 3')
+        a.add('C1 3 0')
+        a.add('R2 3 0')
+
+        b = Circuit(solver='inverse')
+        b.add('V1 1 0 {V1 / s}')
+        b.add('R1 1 2')
+        b.add('L1 2 3')
+        b.add('C1 3 0')
+        b.add('R2 3 0')
+
+        self.assertEqual2(a[3].V, b[3].V, "Node voltage incorrect")
+        self.assertEqual2(a.R2.I, b.R2.I, "R2 current incorrect")
+        self.assertEqual2(a.L1.I, b.L1.I, "L1 current incorrect")
+        self.assertEqual2(a.Z(3, 0), b.Z(3, 0), "Impedance incorrect")
+
+        from lcapy.sparsesolve import FractionFreeSolver
+
+        A = sym.Matrix([[2, 0, 0], [1, 1, 0], [0, 0, 4]])
+        solver = FractionFreeSolver(A, sym.Matrix([2, 3, 8]))
+        self.assertEqual(solver.unknown(2), [2], "Unknown incorrect")
+        self.assertEqual(sorted(solver._y), [2], "Other unknowns found")
+        self.assertEqual(solver.solution(), sym.Matrix([1, 2, 2]),
+                         "Solution incorrect")
+
+    def test_numeric_solve(self):
+        """Lcapy: check numeric MNA solver
+
+        """
+
+        a = Circuit()
+        a.add('V1 1 0 10')
+        a.add('R1 1 2 1000')
+        a.add('R2 2 0 3000')
+        a.add('I1 0 2 1e-3')
+
+        Vdict, Idict = a.numeric_solve()
+        self.assertAlmostEqual(Vdict['2'], 6.75, 9, "Node voltage incorrect")
+        self.assertAlmostEqual(Idict['R1'], 3.25e-3, 9, "R1 current incorrect")
+        self.assertAlmostEqual(Idict['V1'], -3.25e-3, 9, "V1 current incorrect")
+
+        a = Circuit()
+        a.add('V1 1 0 s {10 / s}')
+        a.add('R1 1 2 1000')
+        a.add('C1 2 0 1e-3')
+
+        Vdict, Idict = a.numeric_solve('s', 2j)
+        self.assertAlmostEqual(Vdict[2], -2 - 1j, 9, "Node voltage incorrect")
+        self.assertAlmostEqual(Idict['C1'], 2e-3 - 4e-3j, 9, "C1 current incorrect")
+
+        a = Circuit()
+        a.add('V1 1 0 ac 1')
+        a.add('R1 1 2 2')
+        a.add('C1 2 0 3')
+
+        omega = a.kinds[0]
+        V2 = a[2].V[omega].expr
+        for omega0 in (0.5, 3):
+            Vdict, Idict = a.numeric_solve(omega, omega0)
+            self.assertAlmostEqual(Vdict[2], complex(V2.subs(omega, omega0)),
+                                   9, "AC node voltage incorrect")
+
+    def test_sweep(self):
+        """Lcapy: check frequency sweep
+
+        """
+
+        a = Circuit()
+        a.add('V1 1 0 {DiracDelta(t)}')
+        a.add('R1 1 2 1000')
+        a.add('C1 2 0 1e-6')
+
+        f = [0, 1000 / (2 * 3.141592653589793), 1e6]
+        H = a.sweep(2, f)
+        self.assertAlmostEqual(H[0], 1, 9, "DC response incorrect")
+        self.assertAlmostEqual(H[1], 0.5 - 0.5j, 9, "Response incorrect")
+        I = a.sweep('C1', f, 'I')
+        self.assertAlmostEqual(I[0], 0, 9, "DC current incorrect")
+        self.assertAlmostEqual(I[1], 0.5e-3 + 0.5e-3j, 9, "Current incorrect")
+
+        # Currents through controlled sources from KCL.
+        a = Circuit()
+        a.add('V1 1 0 {DiracDelta(t)}')
+        a.add('R1 1 0 2')
+        a.add('C1 1 0 1')
+        a.add('F1 2 0 V1 2')
+        a.add('R2 2 0 1')
+        a.add('G1 3 0 1 0 2')
+        a.add('R3 3 0 1')
+        I = a.sweep('F1', f, 'I')
+        self.assertAlmostEqual(I[1], -a.sweep('R2', f, 'I')[1], 9,
+                               "F1 current incorrect")
+        I = a.sweep('G1', f, 'I')
+        self.assertAlmostEqual(I[1], -a.sweep('R3', f, 'I')[1], 9,
+                               "G1 current incorrect")
+        a.add('P1 3 0')
+        self.assertAlmostEqual(a.sweep('P1', f, 'I')[1], 0, 9,
+                               "Port current incorrect")
+
+    def test_param_sweep(self):
+        """Lcapy: check component value sweep
+
+        """
+
+        import numpy as np
+
+        a = Circuit()
+        a.add('V1 1 0 {DiracDelta(t)}')
+        a.add('R1 1 2')
+        a.add('C1 2 0')
+
+        f = [0, 1000 / (2 * 3.141592653589793), 1e6]
+        params = {'R1': [1000, 2000], 'C1': [0.5e-6, 1e-6, 2e-6]}
+        H = a.sweep(2, f, params=params)
+        self.assertEqual(H.shape, (2, 3, 3), "Sweep shape incorrect")
+        self.assertAlmostEqual(H[0, 1, 1], 0.5 - 0.5j, 9,
+                               "Response incorrect")
+        self.assertAlmostEqual(H[1, 0, 1], 0.5 - 0.5j, 9,
+                               "Response incorrect")
+        I = a.sweep('C1', f, 'I', params=params)
+        self.assertAlmostEqual(I[0, 1, 1], 0.5e-3 + 0.5e-3j, 9,
+                               "Current incorrect")
+        with self.assertRaises(ValueError):
+            a.sweep(2, f, params={'R1': [1000]})
+
+    def test_mna_cache(self):
+        """Lcapy: check on-disk MNA cache
+
+        """
+
+        import os
+        import tempfile
+        import shutil
+        from lcapy import config
+        from lcapy.mnacache import cache_clear
+
+        cache_dir = tempfile.mkdtemp()
+        config.mna_cache_dir = cache_dir
+        try:
+            a = Circuit()
+            a.add('V1 1 0 {u(t)}')
+            a.add('R1 1 2')
+            a.add('C1 2 0')
+            V = a[2].V
+            I = a.C1.I
+            self.assertEqual(len(os.listdir(cache_dir)), 1, "Not cached")
+
+            b = Circuit()
+            b.add('V1 1 0 {u(t)}')
+            b.add('R1 1 2')
+            b.add('C1 2 0')
+            self.assertEqual(b[2].V, V, "Cached voltage incorrect")
+            self.assertEqual(b.C1.I, I, "Cached current incorrect")
+            self.assertEqual(len(os.listdir(cache_dir)), 1, "Not reused")
+
+            cache_clear()
+            self.assertEqual(os.listdir(cache_dir), [], "Not cleared")
+        finally:
+            config.mna_cache_dir = None
+            shutil.rmtree(cache_dir)
+
+    def test_kill_copy(self):
+        """Lcapy: check netlist transformations without parsing
+
+        """
+
+        a = Circuit()
+        a.add('V1 1 0 {u(t)}')
+        a.add('R1 1 2')
+        a.add('C1 2 3 C1 2')
+        a.add('L1 3 0')
+        a.add('W 3 4')
+
+        b = a.copy()
+        self.assertEqual(str(b), str(a), "copy incorrect")
+        self.assertIs(b.R1.cct, b, "copy not bound to new netlist")
+        self.assertEqual(str(a.kill()), 'W 1 0\nR1 1 2\nC1 2 3 C1\nL1 3 0\nW 3 4',
+                         "kill incorrect")
+        c = a.renumber({'0': '0', '1': '5', '2': '6', '3': '7', '4': '8'})
+        self.assertEqual(c.R1.nodes, ('5', '6'), "renumber incorrect")
+        c.add('W 8 9')
+        self.assertEqual(len(c.elements), 6, "anonymous name reused")
+
+    def test_shared_solve(self):
+        """Lcapy: check sub-netlists with the same A matrix solved together
+
+        """
+
+        a = Circuit()
+        a.add('I1 1 0 noise 3')
+        a.add('I2 1 0 noise 4')
+        a.add('R1 1 0 2')
+        subs = [sub for key, sub in a.sub.items() if key[0] == 'n']
+        self.assertEqual(len(subs), 2, "Incorrect number of noise sources")
+        subs[0].get_Vd(1, 0)
+        self.assertTrue(hasattr(subs[1], '_shared_results'), "Not shared")
+        V1 = a.R1.V.n
+        self.assertEqual2(V1, Vn(10, nid=V1.nid), "Incorrect noise sum")
+
+    def test_lazy_solve(self):
+        """Lcapy: check node voltages and currents found on demand
+
+        """
+
+        from lcapy import config
+
+        a = Circuit()
+        a.add('V1 1 0 {u(t)}')
+        a.add('R1 1 2')
+        a.add('C1 2 0')
+        a.add('R2 2 0')
+        sub = a.sub['s']
+        sub.get_Vd('2', '0')
+        self.assertTrue('R1' in sub._Idict._funcs, "R1 current found")
+
+        config.mna_lazy = False
+        try:
+            b = Circuit()
+            b.add('V1 1 0 {u(t)}')
+            b.add('R1 1 2')
+            b.add('C1 2 0')
+            b.add('R2 2 0')
+            self.assertEqual(b[2].V, a[2].V, "Lazy voltage incorrect")
+            self.assertEqual(b.R1.I, a.R1.I, "Lazy current incorrect")
+            self.assertEqual(b.sub['s']._Idict._funcs, {}, "Not solved")
+        finally:
+            config.mna_lazy = True
+
+    def test_simplify_level(self):
+        """Lcapy: check simplification levels of MNA results
+
+        """
+
+        for level in ('none', 'cancel', 'factor', 'full'):
+            a = Circuit(simplify_level=level)
+            a.add('V1 1 0 {u(t)}')
+            a.add('R1 1 2')
+            a.add('C1 2 0')
+            a.add('R2 2 0')
+            self.assertEqual2(a[2].V.s, Vs('R2 / (s * C1 * R1 * R2 + R1 + R2) / s'),
+                              "Incorrect voltage for %s" % level)
+
+        a = Circuit(simplify_level='foo')
+        a.add('V1 1 0 1')
+        a.add('R1 1 0')
+        self.assertRaises(ValueError, lambda: a[1].V)
+
+    def test_bulk_add(self):
+        """Lcapy: check adding nets in bulk
+
+        """
+
+        import io
+
+        a = Circuit()
+        a.add('V1 1 0 {u(t)}')
+        a[1].V
+        lines = []
+        a.bulk_add(io.StringIO('R1 1 2\n\nC1 2 0\n'), progress=lines.append)
+        self.assertEqual(str(a), 'V1 1 0 {u(t)}\nR1 1 2\nC1 2 0',
+                         "bulk_add incorrect")
+        self.assertEqual(lines, [1, 2, 3], "Progress line numbers incorrect")
+        self.assertFalse(hasattr(a, '_sub'), "Not invalidated")
+
+        with self.assertRaises(ValueError) as cm:
+            a.bulk_add(['R2 2 3', 'R3 3'])
+        self.assertTrue(str(cm.exception).startswith('line 2:'),
+                        "Line number not reported")
+
+    def test_equipotential_nodes(self):
+        """Lcapy: check nodes connected by wires
+
+        """
+
+        a = Circuit()
+        a.add('V1 1 0 10')
+        a.add('W 1 2')
+        a.add('W 3 2')
+        a.add('R1 3 4 5')
+        a.add('W 4 0')
+        self.assertEqual(a.equipotential_nodes,
+                         {'1': ['1', '2', '3'], '0': ['0', '4']},
+                         "Equipotential nodes incorrect")
+        self.assertEqual(a.R1.I.dc, 2, "Current incorrect")
+        a.remove('Wanon2')
+        a.add('W 4 0')
+        self.assertEqual(a.equipotential_nodes,
+                         {'1': ['1', '2'], '0': ['0', '4'], '3': ['3']},
+                         "Equipotential nodes incorrect after remove")
+
+    def test_port_impedances(self):
+        """Lcapy: check port parameters found without test sources
+
+        """
+
+        a = Circuit()
+        a.add('R1 1 2 2')
+        a.add('R2 2 0 4')
+        a.add('R3 3 2 1')
+        self.assertEqual(a.impedance(1, 0), 6, "Impedance incorrect")
+        self.assertEqual(a.admittance(3, 0), sym.Rational(1, 5),
+                         "Admittance incorrect")
+        self.assertEqual(a.transfer(1, 0, 2, 0), sym.Rational(2, 3),
+                         "Transfer incorrect")
+        A = a.Amatrix(1, 0, 3, 0)
+        self.assertEqual(A, sym.Matrix([[sym.Rational(3, 2), sym.Rational(7, 2)],
+                                        [sym.Rational(-1, 4), sym.Rational(-5, 4)]]),
+                         "A matrix incorrect")
+        self.assertEqual(str(a), 'R1 1 2 2\nR2 2 0 4\nR3 3 2 1',
+                         "Netlist modified")
+        a.add('R4 2 0 4')
+        self.assertEqual(a.impedance(1, 0), 4, "Impedance not updated")
+
+        b = Circuit()
+        b.add('R1 1 2')
+        b.add('C1 2 0')
+        b.add('L1 2 3')
+        b.add('R2 3 0')
+        A = b.Amatrix(1, 0, 3, 0)
+        self.assertEqual(str(A), 'Matrix([[(C_1*L_1*R_1*s**2 + C_1*R_1*R_2*s'
+                         ' + L_1*s + R_1 + R_2)/R_2, C_1*L_1*R_1*s**2 + L_1*s'
+                         ' + R_1], [-(C_1*L_1*s**2 + C_1*R_2*s + 1)/R_2,'
+                         ' -C_1*L_1*s**2 - 1]])', "A matrix not cancelled")
+
+    def test_schematic_positions(self):
+        """Lcapy: check schematic node positions
+
+        """
+
+        from lcapy.schematic import Schematic
+
+        a = Schematic()
+        # Long enough to have overflowed a recursive traversal.
+        for n in range(1, 1501):
+            a.add('R%d %d %d; right' % (n, n, n + 1))
+        a.add('C1 1501 0; down')
+        a._positions_calculate()
+        self.assertEqual(a.width, 1500, "Width incorrect")
+        self.assertEqual(a.height, 1, "Height incorrect")
+        self.assertEqual(a.nodes['751'].pos.x, 750 * a.node_spacing,
+                         "Position incorrect")
+
+    def test_render_cache(self):
+        """Lcapy: check on-disk cache of rendered schematics
+
+        """
+
+        import os
+        import tempfile
+        import shutil
+        from lcapy import config
+        from lcapy.rendercache import cache_key, cache_load, cache_store
+        from lcapy.rendercache import cache_clear
+        from lcapy.schematic import draw_batch, _init_worker
+        from lcapy import system
+
+        key = cache_key('content', '.png', 2, '2019/03/20')
+        self.assertNotEqual(key, cache_key('content2', '.png', 2, '2019/03/20'),
+                            "Key independent of content")
+        self.assertNotEqual(key, cache_key('content', '.svg', 2, '2019/03/20'),
+                            "Key independent of type")
+        self.assertNotEqual(key, cache_key('content', '.png', 1, '2019/03/20'),
+                            "Key independent of oversample")
+        self.assertEqual(key, cache_key('content', '.png', 2.0, '2019/03/20'),
+                         "Key depends on oversample type")
+
+        tmp_dir = tempfile.mkdtemp()
+        config.render_cache_dir = os.path.join(tmp_dir, 'cache')
+        try:
+            filename = os.path.join(tmp_dir, 'a.png')
+            self.assertFalse(cache_load(key, filename), "Not empty")
+            with open(filename, 'wb') as f:
+                f.write(b'png')
+            cache_store(key, filename)
+            os.remove(filename)
+            self.assertTrue(cache_load(key, filename), "Not cached")
+            with open(filename, 'rb') as f:
+                self.assertEqual(f.read(), b'png', "Cached file incorrect")
+
+            cache_clear()
+            self.assertEqual(os.listdir(config.render_cache_dir), [],
+                             "Not cleared")
+
+            with self.assertRaises(RuntimeError):
+                draw_batch([os.path.join(tmp_dir, 'missing.sch')],
+                           processes=1)
+
+            # The settings are passed to spawned processes.
+            version = system._circuitikz_version
+            cache_dir = config.render_cache_dir
+            config.render_cache_dir = None
+            _init_worker(cache_dir, config.render_cache_size, '2019/03/20')
+            self.assertEqual(config.render_cache_dir, cache_dir,
+                             "Cache directory not set")
+            self.assertEqual(system.circuitikz_version(), '2019/03/20',
+                             "Circuitikz version not set")
+            system._circuitikz_version = version
+        finally:
+            config.render_cache_dir = None
+            shutil.rmtree(tmp_dir)
@@ -319,6 +319,15 @@ class LcapyTester(unittest.TestCase):
         self.assertEqual(a.evaluate(0j), 0j, "Evaluate fail for sqrt(0j)")
         self.assertEqual(a.evaluate(2j), 1 + 1j, "Evaluate fail for sqrt(1+1j)")
         self.assertEqual(a.evaluate(4), 2, "Evaluate fail for sqrt(4)")
+        self.assertEqual(list(a.evaluate((-4, 4))), [2j, 2],
+                         "Evaluate fail for sqrt vector")
+        a = exp(-t) * Heaviside(t)
+        self.assertEqual(list(a.evaluate((-1000, 0))), [0, 1],
+                         "Evaluate fail for exp(-t) * u(t)")
+        self.assertEqual(list(DiracDelta(t).evaluate((0, 1))), [float('inf'), 0],
+                         "Evaluate fail for DiracDelta vector")
+        self.assertEqual(list((t * 0 + 3).evaluate((1, 2))), [3, 3],
+                         "Evaluate fail for constant vector")
 
     def test_zp2k(self):
 
@@ -345,6 +354,197 @@ class LcapyTester(unittest.TestCase):
         self.assertEqual((1 / (s + 1))(j * omega).inverse_fourier(), exp(-t) * Heaviside(t))
         self.assertEqual((1 / (s + 1))(j * omega)(2 * pi * f).inverse_fourier(), exp(-t) * Heaviside(t))
 
+    def test_transient_response_residue(self):
+
+        import numpy as np
+
+        tv = np.linspace(-1, 10, 12)
+        H = Hs('1 / ((s + 1)**2 * (s**2 + s + 1) * (s + 3))', causal=True)
+        self.assertTrue(np.allclose(H.transient_response(tv, method='residue'),
+                                    H.transient_response(tv)),
+                        "Residue response incorrect")
+        H = Hs('exp(-s) * (s + 2) / (s**2 + 3 * s + 2)', causal=True)
+        self.assertTrue(np.allclose(H.step_response(tv, method='residue'),
+                                    H.step_response(tv)),
+                        "Residue step response incorrect")
+        H = Hs('1 / (s + 1)')
+        self.assertTrue(np.isnan(H.transient_response(-1, method='residue')),
+                        "Residue response not unknown for t < 0")
+        tv = np.array([-1, 0.5, 1.5, 3])
+        for expr in ('exp(-2 * s) / (s + 1)', 'exp(-2 * s) / s',
+                     'exp(-2 * s) * (s + 2) / (s + 1)'):
+            H = Hs(expr)
+            h1 = H.transient_response(tv, method='residue')
+            h2 = H.transient_response(tv)
+            self.assertTrue(np.allclose(h1, h2, equal_nan=True),
+                            "Residue response incorrect for %s" % expr)
+
+    def test_response(self):
+
+        import numpy as np
+
+        t = np.arange(0, 5, 0.01)
+        x = np.ones(len(t))
+        H = Hs('exp(-s) * (s + 2) / (s + 1)', causal=True)
+        y = H.response(x, t)
+        self.assertTrue(np.allclose(y, H.step_response(t, method='residue')),
+                        "lfilter response incorrect")
+        y = H.response(x, t, method='fft')
+        self.assertTrue(np.allclose(y, H.step_response(t, method='residue')),
+                        "fft response incorrect")
+
+    def test_stream_filter(self):
+
+        import numpy as np
+
+        t = np.arange(0, 5, 0.01)
+        x = np.cos(3 * t)
+        H = Hs('exp(-0.125 * s) * (s + 2) / (s**2 + s + 1)', causal=True)
+        y = H.response(x, t)
+        filt = H.stream_filter(t[1] - t[0])
+        y2 = np.hstack(list(filt.blocks(np.array_split(x, 7))))
+        self.assertTrue(np.allclose(y, y2), "Block response incorrect")
+        filt.reset()
+        y3 = filt.filter(x, chunk_size=33)
+        self.assertTrue(np.allclose(y, y3), "Chunked response incorrect")
+
+        # Improper transfer function with a step after ten samples.
+        x = np.ones(len(t))
+        x[0:10] = 0
+        H = Hs('(s**2 + 1) / (s + 4)', causal=True)
+        filt = H.stream_filter(t[1] - t[0])
+        y = np.hstack(list(filt.blocks(np.array_split(x, 7))))
+        self.assertTrue(np.allclose(y, H.response(x, t, method='fft')),
+                        "Improper block response incorrect")
+
+    def test_sweep(self):
+
+        import numpy as np
+
+        H = Hs('1 / (s * R * C + 1)')
+        R = np.array([1, 2])
+        C = np.array([1, 2, 3])
+        svector = np.array([0, 1j])
+        y = H.sweep({'R': R, 'C': C}, svector)
+        self.assertEqual(y.shape, (2, 3, 2), "Sweep shape incorrect")
+        self.assertTrue(np.allclose(y[1, 2],
+                                    1 / (svector * 2 * 3 + 1)),
+                        "Sweep incorrect")
+        self.assertTrue(np.allclose(cExpr('2 * a').sweep({'a': R}), [2, 4]),
+                        "Constant sweep incorrect")
+        with self.assertRaises(ValueError):
+            H.sweep({'R': R}, svector)
+
+    def test_interned(self):
+
+        a = Zs('R1 + 1 / (s * C1)')
+        b = Zs('R1 + 1 / (s * C1)')
+        self.assertTrue(a.expr is b.expr, "Value not interned")
+        self.assertEqual(a, b, "Interned values not equal")
+        self.assertTrue(a == Zs(a.expr), "Shared values not equal")
+        self.assertFalse(hasattr(a, '__dict__'), "Expr has __dict__")
+        self.assertEqual(Vs(1).dB.label, 's-Voltage magnitude (dB)',
+                         "Label incorrect")
+
+    def test_parse_cache(self):
+
+        import sympy as sym
+        from lcapy.sym import parse, parse_cache
+
+        symbols = {}
+        a = parse('x + y', symbols, local_dict=symbols)
+        hits = parse_cache.hits
+        self.assertTrue(parse('x + y', symbols, local_dict=symbols) is a,
+                        "Parse result not cached")
+        self.assertEqual(parse_cache.hits, hits + 1, "Parse cache not hit")
+        symbols['x'] = sym.Symbol('x', real=True)
+        b = parse('x + y', symbols, local_dict=symbols)
+        self.assertFalse(b is a, "Parse result not invalidated")
+        self.assertTrue(symbols['x'] in b.free_symbols,
+                        "Redefined symbol not used")
+        # The key refers to the symbols, so its id cannot be reused.
+        self.assertTrue(any(key[1].obj is symbols
+                            for key in parse_cache._results),
+                        "Symbols not referenced by key")
+        self.assertFalse(parse_cache.persist, "Parse cache saved")
+        self.assertEqual(parse('1e-6'), sym.Rational(1, 1000000),
+                         "Number incorrect")
+        self.assertEqual(parse('2.5'), sym.Rational(5, 2), "Number incorrect")
+        self.assertTrue(parse('10').is_Integer, "Integer not exact")
+
+        from lcapy import config
+        from lcapy.sym import symbols_find, symbols_cache
+
+        size = config.symbols_cache_size
+        config.symbols_cache_size = 1
+        try:
+            self.assertEqual(symbols_find('x + y'), ['x', 'y'],
+                             "Symbols incorrect")
+            self.assertEqual(symbols_find('x + z'), ['x', 'z'],
+                             "Symbols incorrect")
+            self.assertEqual(len(symbols_cache), 1,
+                             "Symbols cache size not changed")
+        finally:
+            config.symbols_cache_size = size
+
+    def test_transform_cache(self):
+
+        from lcapy.transformcache import TransformCache, cache_stats, caches
+
+        cache = TransformCache('test', size=2)
+        del caches['test']
+        self.assertEqual(cache.get(1), None, "Cache miss")
+        cache[1] = 'a'
+        cache[2] = 'b'
+        self.assertEqual(cache.get(1), 'a', "Cache hit")
+        cache[3] = 'c'
+        self.assertEqual(2 in cache, False, "LRU result not evicted")
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1,
+                                         'evictions': 1, 'invalidations': 0,
+                                         'size': 2, 'maxsize': 2},
+                         "Cache stats")
+
+        stats = cache_stats()['laplace']
+        (exp(-3 * t) * Heaviside(t)).laplace()
+        (exp(-3 * t) * Heaviside(t)).laplace()
+        self.assertEqual(cache_stats()['laplace']['hits'] > stats['hits'],
+                         True, "Laplace cache not used")
+
+        import os
+        import pickle
+        import tempfile
+        from lcapy import config
+        from lcapy.transformcache import TransformCache, cache_save, caches
+
+        size = config.evaluate_cache_size
+        config.evaluate_cache_size = 1
+        try:
+            (2 * t).evaluate(np.array([1.0, 2.0]))
+            (3 * t).evaluate(np.array([1.0, 2.0]))
+            self.assertEqual(cache_stats()['evaluate']['size'], 1,
+                             "Evaluate cache size not changed")
+        finally:
+            config.evaluate_cache_size = size
+
+        # Only save the caches under test; the other caches may hold
+        # results that cannot be pickled or that are shared with
+        # other tests.
+        saved = dict(caches)
+        caches.clear()
+        caches['evaluate'] = saved['evaluate']
+        TransformCache('test')[1] = 2
+        filename = tempfile.mktemp(suffix='.pkl')
+        try:
+            cache_save(filename)
+            with open(filename, 'rb') as f:
+                data = pickle.load(f)
+        finally:
+            caches.clear()
+            caches.update(saved)
+            os.remove(filename)
+        self.assertFalse('evaluate' in data, "Functions saved")
+        self.assertEqual(data['test'], [(1, 2)], "Results not saved")
+
     def test_rms(self):
 
         self.assertEqual(Vconst(2).rms(), Vt(2))
@@ -244,3 +244,23 @@ class LcapyTester(unittest.TestCase):
         self.assertEqual2(a.isc, 10 * cos(omega * t), "AC incorrect.")
 
 
+
+    def test_reduce(self):
+        """Lcapy: check series/parallel reduction"""
+
+        a = R(1) + C(2) | L(3)
+        Z = a.Z
+        self.assertFalse(hasattr(a, '_cct'), "Circuit created.")
+        self.assertEqual2(Z, a.cct.impedance(1, 0), "Z incorrect.")
+
+        b = (Vdc(5) + R(2)) | (Vdc(3) + R(4))
+        self.assertEqual(b.Z, sym.Rational(4, 3), "Z incorrect.")
+        self.assertEqual(b.Voc.dc, sym.Rational(13, 3), "Voc incorrect.")
+        self.assertEqual(b.Isc.dc, sym.Rational(13, 4), "Isc incorrect.")
+
+        c = C(2, 5) + R(1)
+        self.assertEqual2(c.Voc.s, 5 / s, "Voc incorrect.")
+
+        # Cannot be reduced so uses MNA.
+        d = (Vdc(5) + L(2)) | R(1)
+        self.assertEqual(d.Voc.dc, 5, "Voc incorrect.")
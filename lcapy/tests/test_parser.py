@@ -2,7 +2,7 @@ from nose.tools import *
 import sys
 sys.path.append('..')
 
-from lcapy.parser import Parser
+from lcapy.parser import Parser, get_parser, split
 import lcapy.schemcpts as schemcpts
 import lcapy.grammar as grammar
 
@@ -72,3 +72,17 @@ def test_opamp():
     '''Test opamp'''
     
     assert_equals(type(parse('E 1 2 opamp 3 4')), schemcpts.classes['Eopamp'], 'Class not Eopamp')
+
+def test_split():
+    '''Test splitting fields'''
+
+    assert_equals(split('R1 1\t2,(3)', grammar.delimiters),
+                  ['R1', '1', '2', '3'], 'Fields incorrect')
+    assert_equals(split('V1 1 2 {a * (5, 6)} "b c"', grammar.delimiters),
+                  ['V1', '1', '2', '{a * (5, 6)}', '"b c"'],
+                  'Escaped fields incorrect')
+
+def test_get_parser():
+    '''Test parser is shared'''
+
+    assert get_parser(schemcpts, grammar) is get_parser(schemcpts, grammar)
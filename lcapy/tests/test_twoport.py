@@ -325,3 +325,54 @@ class LcapyTester(unittest.TestCase):
         self.assertEqual(d.B.B12, -10, "incorrect B12.")
         self.assertEqual(d.B.B21, -0.05, "incorrect B21.")
         self.assertEqual(d.B.B22, 1.5, "incorrect B22.")
+
+    def test_conversions(self):
+        """Lcapy: check cached two-port matrix conversions
+
+        """
+
+        from lcapy.twoport import AMatrix, GMatrix
+
+        a = AMatrix(sym.Integer(1), sym.Integer(2), sym.Integer(3),
+                    sym.Integer(7))
+        self.assertTrue(a.B is a.B, "B not cached.")
+        self.assertTrue(a.B.A is a, "A not cached.")
+        self.assertEqual(a.B.B12, -2, "incorrect B12.")
+        self.assertEqual(a.Z.Y, a.Y, "incorrect Y.")
+
+        g = GMatrix(sym.Integer(1), sym.Integer(2), sym.Integer(3),
+                    sym.Integer(5))
+        self.assertEqual(g.H.H11, -5, "incorrect H11.")
+        self.assertEqual(g.H.G, g, "incorrect G.")
+
+        b = AMatrix(symbol('x'), 0, 0, 1)
+        self.assertEqual(b.B.B11, 1 / symbol('x'), "incorrect B11.")
+        b[0, 0] = 2
+        self.assertEqual(b.B.B11, sym.Rational(1, 2), "Cache not cleared.")
+
+        n = Ladder(R(2), C(3), R(4))
+        self.assertEqual(str(n.A), 'Matrix([[6*s + 1, 24*s + 6], '
+                         '[3*s, 12*s + 1]])', "A not simplified.")
+        self.assertEqual(n.Z[0, 1], 1 / (3 * s), "Z12 not simplified.")
+
+    def test_numeric(self):
+        """Lcapy: check numeric two-port evaluation
+
+        """
+
+        import numpy as np
+
+        a = Ladder(L(1e-3), C(1e-6), L(1e-3), C(1e-6))
+        f = np.array([10, 1e3, 1e5])
+        svector = 2j * np.pi * f
+        self.assertEqual(a.numeric_A(f).shape, (3, 2, 2), "Shape incorrect.")
+        self.assertFalse(hasattr(a, '_chained'), "Symbolic product found.")
+        self.assertTrue(np.allclose(a.numeric_Vgain(f),
+                                    a.Vgain12.evaluate(svector)),
+                        "Vgain incorrect.")
+        self.assertTrue(np.allclose(a.numeric_Igain(f, 2, 1),
+                                    a.Igain(2, 1).evaluate(svector)),
+                        "Igain incorrect.")
+        self.assertTrue(np.allclose(a.numeric_Zin(f),
+                                    a.Z1oc.evaluate(svector)),
+                        "Zin incorrect.")
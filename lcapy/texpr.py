@@ -13,6 +13,8 @@ class tExpr(Expr):
 
     """t-domain expression or symbol."""
 
+    __slots__ = ()
+
     var = tsym
     domain_name = 'Time'
     domain_units = 's'
@@ -107,6 +109,8 @@ class Yt(tExpr):
 
     """t-domain 'admittance' value."""
 
+    __slots__ = ()
+
     units = 'siemens/s'
 
     def __init__(self, val, **assumptions):
@@ -120,6 +124,8 @@ class Zt(tExpr):
 
     """t-domain 'impedance' value."""
 
+    __slots__ = ()
+
     units = 'ohms/s'
 
     def __init__(self, val, **assumptions):
@@ -133,6 +139,8 @@ class Vt(tExpr):
 
     """t-domain voltage (units V)."""
 
+    __slots__ = ()
+
     quantity = 'Voltage'
     units = 'V'
 
@@ -150,6 +158,8 @@ class It(tExpr):
 
     """t-domain current (units A)."""
 
+    __slots__ = ()
+
     quantity = 'Current'
     units = 'A'
 
@@ -168,6 +178,8 @@ class Ht(tExpr):
 
     """impulse response"""
 
+    __slots__ = ()
+
     quantity = 'Impulse response'
     units = '1/s'
 
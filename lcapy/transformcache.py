@@ -0,0 +1,134 @@
+"""This module provides bounded caches for the results of the Laplace
+and Fourier transforms, and for parsed strings.  The least recently
+used results are discarded when a cache holds more than
+`config.<name>_cache_size` results, say `config.parse_cache_size`,
+or `config.transform_cache_size` if this is not defined.
+
+The caches can be inspected with `cache_stats()`, cleared with
+`cache_clear()`, and saved and restored with `cache_save()` and
+`cache_load()`.  Caches created with persist=False, such as the caches
+of parsed strings and of functions for numerical evaluation, are not
+saved.
+
+Copyright 2019 Michael Hayes, UCECE
+
+"""
+
+from __future__ import division
+from collections import OrderedDict
+from . import config
+import pickle
+
+
+class TransformCache(object):
+    """Least recently used cache of transform results."""
+
+    def __init__(self, name, size=None, persist=True):
+
+        self.name = name
+        self.size = size
+        self.persist = persist
+        self._results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        caches[name] = self
+
+    @property
+    def maxsize(self):
+
+        if self.size is not None:
+            return self.size
+        return getattr(config, self.name + '_cache_size',
+                       config.transform_cache_size)
+
+    def __len__(self):
+
+        return len(self._results)
+
+    def __contains__(self, key):
+
+        return key in self._results
+
+    def get(self, key, valid=None):
+        """Return cached result for key or None if not cached.  If
+        valid is specified, it is called with the cached result and
+        the result is discarded if this returns False."""
+
+        try:
+            result = self._results.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        if valid is not None and not valid(result):
+            self.invalidations += 1
+            self.misses += 1
+            return None
+        # Mark as most recently used.
+        self._results[key] = result
+        self.hits += 1
+        return result
+
+    def __setitem__(self, key, result):
+
+        self._results.pop(key, None)
+        self._results[key] = result
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove the results and reset the statistics."""
+
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self):
+        """Return dictionary of cache statistics."""
+
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._results), 'maxsize': self.maxsize}
+
+
+caches = OrderedDict()
+
+
+def cache_stats():
+    """Return dictionary of the statistics for each cache."""
+
+    return dict((name, cache.stats()) for name, cache in caches.items())
+
+
+def cache_clear():
+    """Clear all the caches."""
+
+    for cache in caches.values():
+        cache.clear()
+
+
+def cache_save(filename):
+    """Save the contents of the caches to filename."""
+
+    data = dict((name, list(cache._results.items()))
+                for name, cache in caches.items() if cache.persist)
+    with open(filename, 'wb') as f:
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+
+def cache_load(filename):
+    """Add the results saved in filename to the caches."""
+
+    with open(filename, 'rb') as f:
+        data = pickle.load(f)
+    for name, items in data.items():
+        if name not in caches:
+            continue
+        cache = caches[name]
+        for key, result in items:
+            cache[key] = result
@@ -6,12 +6,14 @@ Copyright 2014--2019 Michael Hayes, UCECE
 
 from __future__ import division
 from warnings import warn
+import numpy as np
 import sympy as sym
 from .symbols import s
 from .sexpr import Vs, Is, Zs, Ys, Hs, sExpr, VsVector, IsVector, YsVector, ZsVector
 from .cexpr import cExpr
 from .vector import Vector
 from .matrix import Matrix
+from .sym import symsimplify
 from .oneport import OnePort, I, V, Y, Z
 from .network import Network
 
@@ -119,47 +121,97 @@ def _check_oneport_args(args):
             raise ValueError('%s not a OnePort' % arg1)
 
 
+def _conversion(method):
+    """Decorator for the properties that convert a two-port matrix to
+    another representation.  The converted matrix is computed once
+    and cached with its elements simplified, and the conversion back
+    to the original representation is recorded so that it does not
+    need computing."""
+
+    name = method.__name__
+
+    def convert(self):
+
+        conversions = self.__dict__.setdefault('_conversions', {})
+        if name not in conversions:
+            result = method(self)
+            if result is not self:
+                result._simplify()
+            conversions[name] = result
+            if result is not self and self._kind is not None:
+                result.__dict__.setdefault('_conversions',
+                                           {}).setdefault(self._kind, self)
+        return conversions[name]
+
+    convert.__doc__ = method.__doc__
+    return property(convert)
+
+
 class TwoPortMatrix(Matrix):
 
-    def __new__(cls, *args):
+    # Name of the representation, say 'A' for AMatrix.
+    _kind = None
 
-        try:
-            args = [arg.simplify() for arg in args]
-        except:
-            pass
+    def __new__(cls, *args):
 
+        # The elements are not simplified here since many matrices
+        # are only used to find others.  The elements of converted
+        # matrices are simplified once when they are cached; see
+        # _conversion.
         if len(args) == 4:
             return super(TwoPortMatrix, cls).__new__(
                 cls, ((args[0], args[1]), (args[2], args[3])))
 
         return super(TwoPortMatrix, cls).__new__(cls, *args)
 
+    def __setitem__(self, key, value):
+
+        # The cached conversions are no longer valid.
+        self.__dict__.pop('_conversions', None)
+        super(TwoPortMatrix, self).__setitem__(key, value)
+
+    def _simplify(self):
+        """Simplify the elements in place."""
+
+        for key in ((0, 0), (0, 1), (1, 0), (1, 1)):
+            item = super(TwoPortMatrix, self).__getitem__(key)
+            if isinstance(item, sym.Expr) and not item.is_Number:
+                super(TwoPortMatrix, self).__setitem__(key,
+                                                       symsimplify(item))
+
+    def _inverse(self):
+        """Return the elements of the inverse of the matrix."""
+
+        det = self.det()
+        return (self[1, 1] / det, -self[0, 1] / det,
+                -self[1, 0] / det, self[0, 0] / det)
+
     # The following properties are fallbacks when other conversions have
     # not been defined.
 
-    @property
+    @_conversion
     def A(self):
-        return AMatrix(self.B.inv())
+        return AMatrix(*self.B._inverse())
 
-    @property
+    @_conversion
     def B(self):
-        return BMatrix(self.A.inv())
+        return BMatrix(*self.A._inverse())
 
-    @property
+    @_conversion
     def G(self):
-        return GMatrix(self.H.inv())
+        return GMatrix(*self.H._inverse())
 
-    @property
+    @_conversion
     def H(self):
-        return HMatrix(self.G.inv())
+        return HMatrix(*self.G._inverse())
 
-    @property
+    @_conversion
     def Y(self):
-        return YMatrix(self.Z.inv())
+        return YMatrix(*self.Z._inverse())
 
-    @property
+    @_conversion
     def Z(self):
-        return ZMatrix(self.Y.inv())
+        return ZMatrix(*self.Y._inverse())
 
     @property
     def A11(self):
@@ -301,12 +353,14 @@ class AMatrix(TwoPortMatrix):
     A = inv(B)
     """
 
+    _kind = 'A'
+
     @property
     def A(self):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_conversion
     def B(self):
 
         # Inverse
@@ -316,7 +370,7 @@ class AMatrix(TwoPortMatrix):
         return BMatrix(self.A22 / det, -self.A12 / det,
                        -self.A21 / det, self.A11 / det)
 
-    @property
+    @_conversion
     def H(self):
 
         if self.A22 == 0:
@@ -324,7 +378,7 @@ class AMatrix(TwoPortMatrix):
         return HMatrix(self.A12 / self.A22, self.det() / self.A22,
                        -1 / self.A22, self.A21 / self.A22)
 
-    @property
+    @_conversion
     def Y(self):
 
         # This produces a bogus Y matrix when A12 is zero (say for a
@@ -334,7 +388,7 @@ class AMatrix(TwoPortMatrix):
         return YMatrix(self.A22 / self.A12, -self.det() / self.A12,
                        -1 / self.A12, self.A11 / self.A12)
 
-    @property
+    @_conversion
     def Z(self):
 
         # This produces a bogus Z matrix when A21 is zero (say for a
@@ -437,7 +491,9 @@ class BMatrix(TwoPortMatrix):
     B = inv(A)
     """
 
-    @property
+    _kind = 'B'
+
+    @_conversion
     def A(self):
         # Inverse
         det = self.det()
@@ -449,25 +505,25 @@ class BMatrix(TwoPortMatrix):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_conversion
     def G(self):
 
         return GMatrix(-self.B21 / self.B22, -1 / self.B22,
                        self.det() / self.B22, -self.B12 / self.B22)
 
-    @property
+    @_conversion
     def H(self):
 
         return HMatrix(-self.B12 / self.B11, 1 / self.B11, -
                        self.det() / self.B11, -self.B21 / self.B11)
 
-    @property
+    @_conversion
     def Y(self):
 
         return YMatrix(-self.B11 / self.B12, 1 / self.B12,
                        self.det() / self.B12, -self.B22 / self.B12)
 
-    @property
+    @_conversion
     def Z(self):
 
         return ZMatrix(-self.B22 / self.B21, -1 / self.B21, -
@@ -673,13 +729,15 @@ class GMatrix(TwoPortMatrix):
     G = inv(H)
     """
 
-    @property
+    _kind = 'G'
+
+    @_conversion
     def A(self):
         # return self.H.A
         return AMatrix(1 / self.G21, self.G22 / self.G21,
                        self.G11 / self.G21, self.det() / self.G21)
 
-    @property
+    @_conversion
     def B(self):
         # return self.H.B
         return BMatrix(-self.det() / self.G12, self.G22 /
@@ -690,15 +748,15 @@ class GMatrix(TwoPortMatrix):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_conversion
     def H(self):
-        return HMatrix(self.inv())
+        return HMatrix(*self._inverse())
 
-    @property
+    @_conversion
     def Y(self):
         return self.H.Y
 
-    @property
+    @_conversion
     def Z(self):
         return self.H.Z
 
@@ -720,12 +778,14 @@ class HMatrix(TwoPortMatrix):
     H = inv(G)
     """
 
-    @property
+    _kind = 'H'
+
+    @_conversion
     def A(self):
         return AMatrix(-self.det() / self.H21, -self.H11 /
                        self.H21, -self.H22 / self.H21, -1 / self.H21)
 
-    @property
+    @_conversion
     def B(self):
         return BMatrix(1 / self.H12, -self.H11 / self.H12, -
                        self.H22 / self.H12, self.det() / self.H12)
@@ -735,12 +795,12 @@ class HMatrix(TwoPortMatrix):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_conversion
     def Y(self):
         return YMatrix(1 / self.H11, -self.H12 / self.H11,
                        self.H21 / self.H11, self.det() / self.H11)
 
-    @property
+    @_conversion
     def Z(self):
         return ZMatrix(self.det() / self.H22, self.H12 / self.H22,
                        -self.H21 / self.H22, 1 / self.H22)
@@ -763,21 +823,23 @@ class YMatrix(TwoPortMatrix):
     Y = inv(Z)
     """
 
+    _kind = 'Y'
+
     @property
     def Ysc(self):
         return YsVector(self.Y11, self.Y22)
 
-    @property
+    @_conversion
     def A(self):
         return AMatrix(-self.Y22 / self.Y21, -1 / self.Y21, -
                        self.det() / self.Y21, -self.Y11 / self.Y21)
 
-    @property
+    @_conversion
     def B(self):
         return BMatrix(-self.Y11 / self.Y12, 1 / self.Y12,
                        self.det() / self.Y12, -self.Y22 / self.Y12)
 
-    @property
+    @_conversion
     def H(self):
         return HMatrix(1 / self.Y11, -self.Y12 / self.Y11,
                        self.Y21 / self.Y11, self.det() / self.Y11)
@@ -787,7 +849,7 @@ class YMatrix(TwoPortMatrix):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_conversion
     def Z(self):
         # Inverse
         det = self.det()
@@ -812,26 +874,28 @@ class ZMatrix(TwoPortMatrix):
     Z = inv(Y)
     """
 
+    _kind = 'Z'
+
     @property
     def Zoc(self):
         return ZsVector(self.Z11, self.Z22)
 
-    @property
+    @_conversion
     def A(self):
         return AMatrix(self.Z11 / self.Z21, self.det() / self.Z21,
                        1 / self.Z21, self.Z22 / self.Z21)
 
-    @property
+    @_conversion
     def B(self):
         return BMatrix(self.Z22 / self.Z12, -self.det() /
                        self.Z12, -1 / self.Z12, self.Z11 / self.Z12)
 
-    @property
+    @_conversion
     def H(self):
         return HMatrix(self.det() / self.Z22, self.Z12 / self.Z22,
                        -self.Z21 / self.Z22, 1 / self.Z22)
 
-    @property
+    @_conversion
     def Y(self):
         # Inverse
         det = self.det()
@@ -1171,6 +1235,84 @@ class TwoPort(Network):
             return Hs(-1 / self.B22)
         raise ValueError('bad port values')
 
+    def _numeric(self, kind, svector):
+        """Return the A or B matrix, as specified by kind, evaluated for
+        each value of s in the array svector as a complex array of
+        shape (len(svector), 2, 2)."""
+
+        M = getattr(self, kind)
+        result = np.empty((len(svector), 2, 2), dtype=complex)
+        for m in range(2):
+            for n in range(2):
+                result[:, m, n] = sExpr(M[m, n]).evaluate(svector)
+        return result
+
+    def numeric_A(self, fvector):
+        """Return the A (ABCD) matrix evaluated at the frequencies (in
+        Hz) in the array fvector as a complex NumPy array of shape
+        (len(fvector), 2, 2).  For a chain of two-ports, such as a
+        Ladder, the A matrix of each section is evaluated and the
+        matrices are multiplied numerically; the symbolic A matrix
+        of the chain is not found.  The component values must be
+        numeric."""
+
+        svector = 2j * np.pi * np.atleast_1d(np.asarray(fvector))
+        return self._numeric('A', svector)
+
+    def numeric_B(self, fvector):
+        """Return the B matrix evaluated at the frequencies (in Hz) in
+        the array fvector as a complex NumPy array of shape
+        (len(fvector), 2, 2); see numeric_A."""
+
+        svector = 2j * np.pi * np.atleast_1d(np.asarray(fvector))
+        return self._numeric('B', svector)
+
+    # The following use the A matrix for the forward quantities and
+    # the B matrix for the reverse quantities so that the matrices do
+    # not need inverting; the determinant of a long chain is
+    # inaccurate.
+
+    def numeric_Vgain(self, fvector, inport=1, outport=2):
+        """Return the voltage gain for specified ports, with internal
+        sources zero, evaluated at the frequencies (in Hz) in the
+        array fvector; see numeric_A."""
+
+        if inport == outport:
+            return np.ones(len(np.atleast_1d(fvector)), dtype=complex)
+        if inport == 1 and outport == 2:
+            return 1 / self.numeric_A(fvector)[:, 0, 0]
+        if inport == 2 and outport == 1:
+            return 1 / self.numeric_B(fvector)[:, 0, 0]
+        raise ValueError('bad port values')
+
+    def numeric_Igain(self, fvector, inport=1, outport=2):
+        """Return the current gain for specified ports, with internal
+        sources zero, evaluated at the frequencies (in Hz) in the
+        array fvector; see numeric_A."""
+
+        if inport == outport:
+            return np.ones(len(np.atleast_1d(fvector)), dtype=complex)
+        if inport == 1 and outport == 2:
+            return -1 / self.numeric_A(fvector)[:, 1, 1]
+        if inport == 2 and outport == 1:
+            return -1 / self.numeric_B(fvector)[:, 1, 1]
+        raise ValueError('bad port values')
+
+    def numeric_Zin(self, fvector, ZL=None):
+        """Return the input impedance, with the output port terminated
+        by the load impedance ZL, evaluated at the frequencies (in
+        Hz) in the array fvector; see numeric_A.  The output port is
+        open circuit if ZL is None.  ZL may be a constant, an array,
+        or an s-domain expression."""
+
+        A = self.numeric_A(fvector)
+        if ZL is None:
+            return A[:, 0, 0] / A[:, 1, 0]
+        if isinstance(ZL, sExpr):
+            ZL = ZL.evaluate(2j * np.pi * np.atleast_1d(np.asarray(fvector)))
+        return ((A[:, 0, 0] * ZL + A[:, 0, 1]) /
+                (A[:, 1, 0] * ZL + A[:, 1, 1]))
+
     @property
     def Vgain12(self):
         """Return V2 / V1 for I2 = 0 (forward voltage gain) with
@@ -1868,18 +2010,56 @@ class Chain(TwoPortBModel):
 
         self.args = args
         self._check_twoport_args()
+        self._sections = args
+
+        # The B matrix of the chain is found when it is first
+        # required since the symbolic product of the B matrices of
+        # the sections can be large; see _product.
+        super(TwoPortBModel, self).__init__()
+
+    def _product(self):
+        """Return tuple of the B matrix, V2b, and I2b of the chain."""
 
-        arg1 = args[-1]
+        if hasattr(self, '_chained'):
+            return self._chained
+
+        arg1 = self._sections[-1]
         B = arg1.B
 
         foo = Vector(arg1.V2b, arg1.I2b)
 
-        for arg in reversed(args[0:-1]):
+        for arg in reversed(self._sections[0:-1]):
 
             foo += B * Vector(arg.V2b, arg.I2b)
             B = B * arg.B
 
-        super(Chain, self).__init__(B, Vs(foo[0, 0]), Is(foo[1, 0]))
+        self._chained = B, Vs(foo[0, 0]), Is(foo[1, 0])
+        return self._chained
+
+    @property
+    def _M(self):
+        return self._product()[0]
+
+    @property
+    def _V2b(self):
+        return self._product()[1]
+
+    @property
+    def _I2b(self):
+        return self._product()[2]
+
+    def _numeric(self, kind, svector):
+
+        # Multiply the matrices of the sections numerically to avoid
+        # the symbolic product.  Note, B = Bn ... B2 B1.
+        sections = self._sections
+        if kind == 'B':
+            sections = reversed(sections)
+        M = None
+        for section in sections:
+            M1 = section._numeric(kind, svector)
+            M = M1 if M is None else np.matmul(M, M1)
+        return M
 
     def simplify(self):
 
@@ -2421,7 +2601,7 @@ class LSection(TwoPortBModel):
         super(LSection, self).__init__(Series(OP1).chain(Shunt(OP2)))
 
 
-class Ladder(TwoPortBModel):
+class Ladder(Chain):
 
     """(Unbalanced) ladder network with alternating Series and Shunt
     networks chained
@@ -2444,16 +2624,17 @@ class Ladder(TwoPortBModel):
         self.args = (OP1, ) + args
         _check_oneport_args(self.args)
 
-        TP = Series(OP1)
+        sections = [Series(OP1)]
 
         for m, arg in enumerate(args):
 
             if m & 1:
-                TP = TP.chain(Series(arg))
+                sections.append(Series(arg))
             else:
-                TP = TP.chain(Shunt(arg))
+                sections.append(Shunt(arg))
 
-        super(Ladder, self).__init__(TP)
+        self._sections = sections
+        super(TwoPortBModel, self).__init__()
 
     def simplify(self):
 
@@ -3,6 +3,7 @@
 Copyright (c) 2014 Michael P. Hayes, UC ECE, NZ
 
 Usage: schtex infile.sch [outfile.tex|pdf|png|svg]
+       schtex --batch [--ext .png] infile1.sch infile2.sch ...
 """
 
 from __future__ import print_function
@@ -30,7 +31,8 @@ def main (argv=None):
 
     version = __doc__.split('\n')[0]
 
-    parser = OptionParser(usage='%prog schematic-file [output-file]', version=version, 
+    parser = OptionParser(usage='%prog schematic-file [output-file]\n'
+                          '       %prog --batch schematic-file ...', version=version, 
                           description=__doc__)
 
     parser.add_option('--debug', action='store_true',
@@ -113,6 +115,22 @@ def main (argv=None):
                       dest='stage', default=0,
                       help='graph analysis stage')
 
+    parser.add_option('--batch', action='store_true',
+                      dest='batch', default=False,
+                      help='draw each schematic file to a file with the extension specified by --ext')
+
+    parser.add_option('--ext', type='str',
+                      dest='ext', default='.png',
+                      help='output file extension for batch mode, default .png')
+
+    parser.add_option('--processes', type='int',
+                      dest='processes', default=None,
+                      help='number of processes for batch mode, default is a process for each CPU')
+
+    parser.add_option('--cache-dir', type='str',
+                      dest='cache_dir', default=None,
+                      help='directory for cache of rendered schematics')
+
     parser.add_option('--pdb', action='store_true',
                       default=False,
                       help="enter python debugger on exception")    
@@ -123,14 +141,52 @@ def main (argv=None):
         parser.error('missing argument')
         return 1
 
+    if options.pdb:
+        sys.excepthook = schtex_exception
+
+    if options.cache_dir is not None:
+        from lcapy import config
+        config.render_cache_dir = options.cache_dir
+
+    if options.label_nodes not in ('none', 'all', 'alpha', 'pins', 'primary', False, None):
+        raise ValueError('Illegal option %s for label_nodes' % options.label_nodes)
+
+    if options.draw_nodes not in ('none', 'all', 'primary', 'connections',
+                                  False, None):
+        raise ValueError('Illegal option %s for draw_nodes' % options.draw_nodes)
+
+    draw_kwargs = dict(label_nodes=options.label_nodes,
+                       draw_nodes=options.draw_nodes,
+                       label_ids=options.label_ids,
+                       label_values=options.label_values, 
+                       scale=options.scale,
+                       node_spacing=options.node_spacing,
+                       cpt_size=options.cpt_size,
+                       help_lines=options.help_lines, debug=options.debug)
+
+    if options.batch:
+        from lcapy.schematic import draw_batch
+
+        models = [model for model, enabled in
+                  (('kill', options.k_model), ('s_model', options.s_model),
+                   ('ac_model', options.ac_model),
+                   ('pre_initial_model', options.p_model)) if enabled]
+        if len(models) > 1:
+            parser.error('only one model option can be used in batch mode')
+            return 1
+
+        ext = options.ext
+        if not ext.startswith('.'):
+            ext = '.' + ext
+        draw_batch(args, ext, model=models[0] if models else None,
+                   processes=options.processes, **draw_kwargs)
+        return 0
+
     infilename = args[0]
     outfilename = None
     if len(args) > 1:
         outfilename = args[1]
 
-    if options.pdb:
-        sys.excepthook = schtex_exception
-        
     from lcapy import Circuit
 
     cct = Circuit(infilename)
@@ -143,24 +199,10 @@ def main (argv=None):
     if options.p_model:
         cct = cct.pre_initial_model()
 
-    if options.label_nodes not in ('none', 'all', 'alpha', 'pins', 'primary', False, None):
-        raise ValueError('Illegal option %s for label_nodes' % options.label_nodes)
-
-    if options.draw_nodes not in ('none', 'all', 'primary', 'connections',
-                                  False, None):
-        raise ValueError('Illegal option %s for draw_nodes' % options.draw_nodes)
-
     nosave = options.xgraph or options.ygraph
 
     if not options.xgraph and not options.ygraph:
-        cct.draw(label_nodes=options.label_nodes,
-                 draw_nodes=options.draw_nodes,
-                 label_ids=options.label_ids,
-                 label_values=options.label_values, 
-                 filename=outfilename, scale=options.scale,
-                 node_spacing=options.node_spacing, cpt_size=options.cpt_size,
-                 help_lines=options.help_lines, debug=options.debug,
-                 nosave=nosave)
+        cct.draw(filename=outfilename, nosave=nosave, **draw_kwargs)
 
     if options.xgraph:
         cct.sch.make_graphs()
@@ -22,6 +22,9 @@ setup(name='lcapy', version='0.30.1',
                   'lcapy.fexpr', 'lcapy.omegaexpr', 'lcapy.sfwexpr',
                   'lcapy.noiseexpr', 'lcapy.phasor', 'lcapy.super',
                   'lcapy.context', 'lcapy.sym', 'lcapy.functions',
-                  'lcapy.printing', 'lcapy.config', 'lcapy.transform'
+                  'lcapy.printing', 'lcapy.config', 'lcapy.transform',
+                  'lcapy.sparsesolve', 'lcapy.mnacache',
+                  'lcapy.transformcache', 'lcapy.streamfilter',
+                  'lcapy.paramsweep', 'lcapy.rendercache'
       ], scripts=['scripts/schtex.py'],
       license='LGPL' )